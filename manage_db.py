@@ -9,8 +9,12 @@ import sys
 # Add current directory to path so we can import orchestrator
 sys.path.append(os.getcwd())
 
+# deploy() creates the schema itself, after the migrations; keep create_app
+# from running create_all first
+os.environ['DB_CREATE_ALL'] = '0'
+
 from orchestrator.app import create_app
-from orchestrator.models import db
+from orchestrator.models import create_schema
 from flask_migrate import upgrade
 
 def deploy():
@@ -22,6 +26,10 @@ def deploy():
         try:
             upgrade()
             print("✓ Database migrations applied.")
+            # No migration creates the schema yet; add missing tables and
+            # the indexes create_all skips on existing ones
+            create_schema()
+            print("✓ Database tables and indexes created.")
         except Exception as e:
             print(f"Error applying migrations: {e}")
             sys.exit(1)
@@ -1,18 +1,41 @@
+import hashlib
 import os
-import uuid
+import secrets
+import threading
+import time
 from datetime import datetime
+import click
+import orjson
 from flask import Flask, render_template, request, jsonify, Response, redirect, url_for, session
+from flask.json.provider import JSONProvider, DefaultJSONProvider
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from flask_migrate import Migrate
+from sqlalchemy import and_, text
+from sqlalchemy.orm import joinedload
 
 from .config import config
-from .models import db, Tournament, Team, User
+from .models import db, create_schema, Tournament, Team, User
 from .tournament_registry import TournamentRegistry
 from .subscription_manager import SubscriptionManager
 
 login_manager = LoginManager()
 migrate = Migrate()
 
+HEALTH_CACHE_SECONDS = 1.0
+NAME_LENGTH = range(2, 51)  # Usernames and display names: 2-50 characters
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson; keys stay sorted like Flask's default."""
+    
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 def create_app(config_name: str = None) -> Flask:
     """Application factory for the orchestrator service."""
@@ -23,6 +46,7 @@ def create_app(config_name: str = None) -> Flask:
                 template_folder='templates',
                 static_folder='static')
     app.config.from_object(config[config_name])
+    app.json = OrjsonProvider(app)
     
     # Initialize extensions
     db.init_app(app)
@@ -35,8 +59,15 @@ def create_app(config_name: str = None) -> Flask:
     subscriptions = SubscriptionManager()
     
     # Create tables
-    with app.app_context():
-        db.create_all()
+    if app.config['DB_CREATE_ALL']:
+        with app.app_context():
+            db.create_all()
+    
+    @app.cli.command('init-db')
+    def init_db():
+        """Create all database tables and indexes."""
+        create_schema()
+        click.echo('Database tables created.')
     
     # Store services on app for access in routes
     app.registry = registry
@@ -91,7 +122,7 @@ def register_routes(app: Flask):
     @app.route('/tournaments/<tournament_id>')
     def tournament_detail(tournament_id: str):
         """Tournament detail/management page."""
-        tournament = app.registry.get_tournament(tournament_id)
+        tournament = app.registry.get_tournament_with_teams(tournament_id)
         if not tournament:
             return render_template('404.html'), 404
         
@@ -106,8 +137,8 @@ def register_routes(app: Flask):
         if not tournament:
             return render_template('404.html'), 404
         
-        # In Monolith mode, we just redirect to the internal route
-        return redirect(url_for('play.play_index', tournament_id=tournament_id))
+        # In Monolith mode, go straight to the bracket (play_index would just redirect again)
+        return redirect(url_for('play.bracket_view', tournament_id=tournament_id))
     
     @app.route('/dashboard')
     def user_dashboard():
@@ -117,11 +148,7 @@ def register_routes(app: Flask):
         
         subscribed_ids = app.subscriptions.get_user_subscriptions(str(current_user.id))
         
-        subscribed_tournaments = []
-        for tid in subscribed_ids:
-            t = app.registry.get_tournament(tid)
-            if t:
-                subscribed_tournaments.append(t)
+        subscribed_tournaments = app.registry.get_tournaments_bulk(subscribed_ids)
         
         return render_template('dashboard.html',
                              user=current_user,
@@ -129,6 +156,45 @@ def register_routes(app: Flask):
                              active_page='dashboard')
 
 
+def _etag_for(*parts) -> str:
+    """ETag derived from the values a response is built from."""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def _conditional_json(etag: str, build_payload) -> Response:
+    """Answer 304 if the client's copy matches etag, else the JSON payload."""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(build_payload())
+    response.set_etag(etag)
+    response.cache_control.no_cache = True  # Always revalidate, never serve stale
+    return response
+
+
+def _probe_database() -> dict:
+    """Run SELECT 1 and report connectivity and latency."""
+    start = time.time()
+    try:
+        db.session.execute(db.text('SELECT 1'))
+    except Exception as e:
+        return {'connected': False, 'latency_ms': None, 'error': str(e)}
+    return {'connected': True, 'latency_ms': round((time.time() - start) * 1000, 2), 'error': None}
+
+
+def _pool_stats() -> dict:
+    """Connection pool counters, or None for pools that don't track them."""
+    pool = db.engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return None
+    return {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': pool.overflow(),
+    }
+
+
 def register_api_routes(app: Flask):
     """Register API routes."""
     
@@ -138,20 +204,26 @@ def register_api_routes(app: Flask):
     def api_list_tournaments():
         """List tournaments with optional filtering."""
         status = request.args.get('status')
-        limit = request.args.get('limit', 50, type=int)
+        limit = max(1, min(request.args.get('limit', 50, type=int), 100))
         offset = request.args.get('offset', 0, type=int)
+        cursor = request.args.get('cursor', type=int)
         
+        # Fetch one extra row to tell whether another page exists
         tournaments = app.registry.list_tournaments(
             status=status,
-            limit=limit,
-            offset=offset
+            limit=limit + 1,
+            offset=offset,
+            cursor=cursor
         )
+        has_more = len(tournaments) > limit
+        tournaments = tournaments[:limit]
         
         return jsonify({
             'tournaments': [t.to_dict() for t in tournaments],
             'count': len(tournaments),
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': tournaments[-1].id if has_more else None
         })
     
     @app.route('/api/v1/tournaments', methods=['POST'])
@@ -164,7 +236,7 @@ def register_api_routes(app: Flask):
         if not current_user.is_admin:
             return jsonify({'error': 'Admin access required to create tournaments'}), 403
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         
         name = data.get('name')
         if not name:
@@ -194,7 +266,9 @@ def register_api_routes(app: Flask):
         if not tournament:
             return jsonify({'error': 'Tournament not found'}), 404
         
-        return jsonify(tournament.to_dict())
+        # Registrations change team_count without touching the tournament row
+        etag = _etag_for(tournament.id, tournament.updated_at, tournament.team_count)
+        return _conditional_json(etag, tournament.to_dict)
     
     @app.route('/api/v1/tournaments/<tournament_id>', methods=['DELETE'])
     def api_delete_tournament(tournament_id: str):
@@ -251,7 +325,13 @@ def register_api_routes(app: Flask):
         if not tournament:
             return jsonify({'error': 'Tournament not found'}), 404
         
-        return jsonify({
+        # Count catches removals; latest updated_at catches adds and result updates
+        team_count, last_update = db.session.query(
+            db.func.count(Team.id), db.func.max(Team.updated_at)
+        ).filter(Team.tournament_id == tournament.id).one()
+        etag = _etag_for(tournament.id, team_count, last_update)
+        
+        return _conditional_json(etag, lambda: {
             'teams': [t.to_dict() for t in tournament.teams],
             'count': len(tournament.teams)
         })
@@ -272,7 +352,7 @@ def register_api_routes(app: Flask):
         if not current_user.is_authenticated:
             return jsonify({'error': 'Authentication required'}), 401
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         tournament_id = data.get('tournament_id')
         
         if not tournament_id:
@@ -294,7 +374,7 @@ def register_api_routes(app: Flask):
         if not current_user.is_authenticated:
             return jsonify({'error': 'Authentication required'}), 401
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         tournament_id = data.get('tournament_id')
         
         if not tournament_id:
@@ -316,32 +396,28 @@ def register_api_routes(app: Flask):
     
     # ==================== Health Check ====================
     
+    # Uptime pingers can hit this several times a second per instance;
+    # collapse them into one database probe per HEALTH_CACHE_SECONDS
+    health_cache = {'checked_at': 0.0, 'result': None}
+    health_lock = threading.Lock()
+    
     @app.route('/health')
     @app.route('/api/v1/health')
     def health_check():
         """Health check endpoint - returns actual database connection status."""
-        import time
-        start = time.time()
-        
-        try:
-            db.session.execute(db.text('SELECT 1'))
-            db_ok = True
-            db_error = None
-        except Exception as e:
-            db_ok = False
-            db_error = str(e)
-        
-        latency_ms = round((time.time() - start) * 1000, 2)
-        status = 'healthy' if db_ok else 'unhealthy'
+        with health_lock:
+            if (health_cache['result'] is None
+                    or time.monotonic() - health_cache['checked_at'] >= HEALTH_CACHE_SECONDS):
+                health_cache['result'] = _probe_database()
+                health_cache['checked_at'] = time.monotonic()
+            database = health_cache['result']
+        
+        status = 'healthy' if database['connected'] else 'unhealthy'
         code = 200 if status == 'healthy' else 503
         
         return jsonify({
             'status': status,
-            'database': {
-                'connected': db_ok,
-                'latency_ms': latency_ms if db_ok else None,
-                'error': db_error
-            },
+            'database': {**database, 'pool': _pool_stats()},
             'timestamp': time.time()
         }), code
 
@@ -357,21 +433,24 @@ def register_auth_routes(app: Flask):
         # Always logout any existing session first
         logout_user()
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         username = data.get('username', '').strip()
         
         if not username:
             return jsonify({'error': 'Username is required'}), 400
         
-        if len(username) < 2 or len(username) > 50:
+        if len(username) not in NAME_LENGTH:
             return jsonify({'error': 'Username must be 2-50 characters'}), 400
         
         # Generate unique session ID
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
         
         # Create user with encrypted username
         user = User.create_user(username=username, session_id=session_id)
         db.session.add(user)
+        if db.engine.dialect.name == 'postgresql':
+            # Anonymous users are cheap to recreate; don't wait on the WAL flush
+            db.session.execute(text('SET LOCAL synchronous_commit = OFF'))
         db.session.commit()
         
         # Log in the user (regular users get default session duration)
@@ -388,14 +467,14 @@ def register_auth_routes(app: Flask):
         # Always logout any existing session first
         logout_user()
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         username = data.get('username', '').strip()
         password = data.get('password', '')
         
         if not username or not password:
             return jsonify({'error': 'Username and password are required'}), 400
         
-        if len(username) < 2 or len(username) > 50:
+        if len(username) not in NAME_LENGTH:
             return jsonify({'error': 'Username must be 2-50 characters'}), 400
         
         if len(password) < 6:
@@ -407,7 +486,7 @@ def register_auth_routes(app: Flask):
             return jsonify({'error': 'Admin username already exists'}), 400
         
         # Generate unique session ID
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
         
         # Create admin user with encrypted username and password
         user = User.create_user(username=username, session_id=session_id, is_admin=True, password=password)
@@ -428,7 +507,7 @@ def register_auth_routes(app: Flask):
         # Always logout any existing session first
         logout_user()
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         username = data.get('username', '').strip()
         password = data.get('password', '')
         
@@ -444,7 +523,7 @@ def register_auth_routes(app: Flask):
             return jsonify({'error': 'Invalid credentials'}), 401
         
         # Update session ID for new login
-        admin.session_id = str(uuid.uuid4())
+        admin.session_id = secrets.token_hex(16)
         admin.last_seen = datetime.utcnow()
         db.session.commit()
         
@@ -481,13 +560,13 @@ def register_auth_routes(app: Flask):
         if not current_user.is_authenticated:
             return jsonify({'error': 'Not authenticated'}), 401
         
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         display_name = data.get('display_name', '').strip()
         
         if not display_name:
             return jsonify({'error': 'Display name is required'}), 400
         
-        if len(display_name) < 2 or len(display_name) > 50:
+        if len(display_name) not in NAME_LENGTH:
             return jsonify({'error': 'Display name must be 2-50 characters'}), 400
         
         current_user.display_name = display_name
@@ -509,17 +588,26 @@ def register_auth_routes(app: Flask):
         
         from .models import Tournament, Team, Match
         
-        t = Tournament.query.filter_by(tournament_id=tournament_id).first()
-        if not t:
+        # Resolve tournament and match together; match is None if it's missing
+        row = db.session.query(Tournament.id, Match).outerjoin(
+            Match,
+            and_(Match.tournament_id == Tournament.id, Match.match_id == match_id)
+        ).filter(Tournament.tournament_id == tournament_id).first()
+        if not row:
             return jsonify({'error': 'Tournament not found'}), 404
         
-        match = Match.query.filter_by(tournament_id=t.id, match_id=match_id).first()
+        t_id, match = row
         if not match:
             return jsonify({'error': 'Match not found'}), 404
         
-        # Find teams in this match
-        team1 = Team.query.filter_by(tournament_id=t.id, team_id=match.team1_id).first()
-        team2 = Team.query.filter_by(tournament_id=t.id, team_id=match.team2_id).first()
+        # Find teams in this match, with captain users, in one query
+        match_teams = Team.query.options(joinedload(Team.captain_user)).filter(
+            Team.tournament_id == t_id,
+            Team.team_id.in_([match.team1_id, match.team2_id])
+        ).all()
+        teams_by_id = {team.team_id: team for team in match_teams}
+        team1 = teams_by_id.get(match.team1_id)
+        team2 = teams_by_id.get(match.team2_id)
         
         # Check if current user is captain of one of the teams
         user_team = None
@@ -4,8 +4,9 @@ import os
 def build_database_url():
     """Build DATABASE_URL from individual env vars or use DATABASE_URL directly."""
     # If DATABASE_URL is set, use it directly
-    if os.getenv('DATABASE_URL'):
-        return os.getenv('DATABASE_URL')
+    database_url = os.getenv('DATABASE_URL')
+    if database_url:
+        return database_url
     
     # Otherwise build from individual components (for Cloud Run with secrets)
     db_user = os.getenv('DB_USER', 'tournament')
@@ -26,7 +27,20 @@ class Config:
     # Database
     SQLALCHEMY_DATABASE_URI = build_database_url()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    
+    # Size DB_POOL_SIZE + DB_MAX_OVERFLOW to the worker's thread count, and
+    # keep instances * that total under the Cloud SQL connection limit
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '10')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '20')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),  # Recycle before Cloud SQL drops idle connections
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', '10')),
+    }
+
+    # Run db.create_all() in create_app; deployments that provision the schema
+    # from manage_db.py set DB_CREATE_ALL=0 to skip it on every cold start
+    DB_CREATE_ALL = os.getenv('DB_CREATE_ALL', '1') == '1'
+
     # Google Cloud
     GCP_PROJECT_ID = os.getenv('GCP_PROJECT_ID', '')
     GCP_REGION = os.getenv('GCP_REGION', 'us-central1')
@@ -45,6 +59,7 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = os.getenv('SQLALCHEMY_DATABASE_URI', 'sqlite:///:memory:')
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # SQLite's static pool takes no pool sizing
     WTF_CSRF_ENABLED = False
 
 
@@ -1,6 +1,31 @@
 import math
+from functools import lru_cache
 from typing import Tuple
 
+_LN10_OVER_400 = math.log(10) / 400  # 10 ** (d / 400) == exp(d * ln(10) / 400)
+
+# FIDE 8.3.1: a larger rating difference counts as 400 for rating purposes
+RATING_DIFFERENCE_CAP = 400
+
+
+@lru_cache(maxsize=4096)
+def _expected_score_for_gap(rating_gap: int) -> float:
+    """Expected score of a player rated rating_gap points below the opponent."""
+    return 1 / (1 + math.exp(rating_gap * _LN10_OVER_400))
+
+
+def expected_score(rating_a: int, rating_b: int) -> float:
+    """Expected score (win probability) of a player rated rating_a against rating_b."""
+    # Ratings sit in a narrow band, so the same gaps recur across matches
+    return _expected_score_for_gap(rating_b - rating_a)
+
+
+def rated_expected_score(rating_a: int, rating_b: int) -> float:
+    """Expected score used for rating changes, with the gap capped at RATING_DIFFERENCE_CAP."""
+    rating_gap = max(-RATING_DIFFERENCE_CAP, min(RATING_DIFFERENCE_CAP, rating_b - rating_a))
+    return _expected_score_for_gap(rating_gap)
+
+
 class EloCalculator:
     """
     ELO rating system for calculating win probabilities and rating changes.
@@ -17,7 +42,7 @@ class EloCalculator:
         Returns:
             (prob_a_wins, prob_b_wins) as floats between 0 and 1
         """
-        expected_a = 1 / (1 + math.pow(10, (rating_b - rating_a) / 400))
+        expected_a = expected_score(rating_a, rating_b)
         expected_b = 1 - expected_a
         return (expected_a, expected_b)
     
@@ -36,23 +61,9 @@ class EloCalculator:
         Returns:
             (new_winner_rating, new_loser_rating)
         """
-        # Calculate expected scores
-        expected_winner = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 400))
-        expected_loser = 1 - expected_winner
-        
-        # Actual scores (1 for win, 0 for loss)
-        actual_winner = 1.0
-        actual_loser = 0.0
-        
-        # Calculate rating changes
-        winner_change = round(self.k_factor * (actual_winner - expected_winner))
-        loser_change = round(self.k_factor * (actual_loser - expected_loser))
+        winner_change, loser_change = self.get_rating_change_amount(winner_rating, loser_rating)
         
-        # Apply changes
-        new_winner_rating = winner_rating + winner_change
-        new_loser_rating = loser_rating + loser_change
-        
-        return (new_winner_rating, new_loser_rating)
+        return (winner_rating + winner_change, loser_rating + loser_change)
     
     def get_rating_change_amount(
         self,
@@ -65,7 +76,7 @@ class EloCalculator:
         Returns:
             (winner_change, loser_change) - can be positive or negative
         """
-        expected_winner = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 400))
+        expected_winner = rated_expected_score(winner_rating, loser_rating)
         expected_loser = 1 - expected_winner
         
         winner_change = round(self.k_factor * (1.0 - expected_winner))
@@ -85,14 +96,7 @@ class EloCalculator:
         Returns:
             (new_rating_a, new_rating_b)
         """
-        expected_a = 1 / (1 + math.pow(10, (rating_b - rating_a) / 400))
-        expected_b = 1 - expected_a
-        
-        # Draw = 0.5 score for both
-        actual_score = 0.5
-        
-        change_a = round(self.k_factor * (actual_score - expected_a))
-        change_b = round(self.k_factor * (actual_score - expected_b))
+        change_a, change_b = self.get_draw_change_amount(rating_a, rating_b)
         
         return (rating_a + change_a, rating_b + change_b)
     
@@ -107,7 +111,7 @@ class EloCalculator:
         Returns:
             (change_a, change_b)
         """
-        expected_a = 1 / (1 + math.pow(10, (rating_b - rating_a) / 400))
+        expected_a = rated_expected_score(rating_a, rating_b)
         expected_b = 1 - expected_a
         
         change_a = round(self.k_factor * (0.5 - expected_a))
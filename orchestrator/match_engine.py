@@ -1,40 +1,116 @@
 import json
 import random
+from collections import deque
+from functools import lru_cache
+from itertools import groupby
+from types import SimpleNamespace
 from typing import List, Dict, Optional, Tuple
-from sqlalchemy import or_
+from sqlalchemy import or_, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from .models import db, Match, Team, Tournament, EloHistory
-from .name_generator import generate_match_name
+from .name_generator import generate_match_names
 from .elo_calculator import EloCalculator
 from .pubsub_manager import get_pubsub_manager
 
+
+@lru_cache(maxsize=64)
+def _circle_pair_indices(team_count: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Index pairs for each round of a full round robin using the circle method.
+    
+    Index 0 stays fixed while the rest rotate one seat per round on a deque.
+    Pairings against the bye slot (odd team counts) are left out. The table
+    only depends on the team count, so it is built once per size.
+    """
+    rest = deque(range(1, team_count))
+    if team_count % 2 == 1:
+        rest.append(None)
+    n = len(rest) + 1
+    
+    rounds = []
+    for _ in range(n - 1):
+        pairs = [(0, rest[-1])]
+        pairs.extend((rest[i - 1], rest[n - 2 - i]) for i in range(1, n // 2))
+        rounds.append(tuple((i, j) for i, j in pairs if i is not None and j is not None))
+        rest.rotate(1)
+    return tuple(rounds)
+
+def _circle_method_rounds(team_ids: List[str]) -> List[List[Tuple[str, str]]]:
+    """Pair teams for a full round robin using the circle method."""
+    return [
+        [(team_ids[i], team_ids[j]) for i, j in round_pairs]
+        for round_pairs in _circle_pair_indices(len(team_ids))
+    ]
+
+def _seeded_pairs(seeded: List) -> List[Tuple]:
+    """
+    Pair a best-first list 1 vs N, 2 vs N-1, ... in bracket order.
+    
+    The bracket is padded to the next power of two, and the top seeds get
+    byes, returned as (team, None). Every round then halves evenly, so
+    advancing winners pairwise keeps the top seeds apart until the final.
+    """
+    if len(seeded) < 2:
+        return []
+    size = 2
+    while size < len(seeded):
+        size *= 2
+    order = [1]
+    while len(order) < size:
+        step = len(order) * 2
+        order = [s for seed in order for s in (seed, step + 1 - seed)]
+    # Every other entry of the bracket order is the better seed of a pair
+    return [
+        (seeded[k - 1], seeded[size - k] if size - k < len(seeded) else None)
+        for k in order[::2]
+    ]
+
+# Football-style ranking: Points desc, Goal Diff desc, Goals For desc; team id
+# breaks remaining ties in registration order
+_STANDINGS_ORDER = (
+    Team.points.desc(),
+    (Team.goals_for - Team.goals_against).desc(),
+    Team.goals_for.desc(),
+    Team.id
+)
+
 class MatchEngine:
-    def __init__(self, tournament_id: str):
+    def __init__(self, tournament_id: str, t_record: Tournament = None):
         self.tournament_id = tournament_id
-        # We need the numeric ID for foreign keys, so we fetch it once or per query
-        self.t_record = Tournament.query.filter_by(tournament_id=tournament_id).first()
+        # We need the numeric ID for foreign keys, so we fetch it once (or reuse the caller's row)
+        self.t_record = t_record or Tournament.query.filter_by(tournament_id=tournament_id).first()
         if not self.t_record:
             raise ValueError(f"Tournament {tournament_id} not found")
         self.db_id = self.t_record.id
+        # Commits expire t_record; mirror current_round and snapshot the settings
+        # so reading them later doesn't re-SELECT the row
+        self._current_round = self.t_record.current_round
+        self.allow_draws = self.t_record.allow_draws
+        self.num_groups = self.t_record.num_groups or 2
+        self.teams_per_group_advance = self.t_record.teams_per_group_advance
         self.elo_calculator = EloCalculator()
         self.pubsub = get_pubsub_manager()
     
     def get_teams(self) -> Dict:
-        teams = Team.query.filter_by(tournament_id=self.db_id).all()
-        return {t.team_id: t.to_dict() for t in teams}
+        # Column rows skip ORM hydration and the identity map, but the query
+        # still autoflushes pending changes
+        return {row.team_id: Team.row_to_dict(row) for row in self._team_rows_query()}
     
-    def register_team(self, team_id: str, name: str, captain: str, group_name: str = None) -> str:
+    def register_team(self, team_id: str, name: str, captain: str, group_name: str = None,
+                      captain_user_id: int = None) -> str:
         team = Team(
             team_id=team_id,
             tournament_id=self.db_id,
             name=name,
             captain=captain,
+            captain_user_id=captain_user_id,
             group_name=group_name
         )
         db.session.add(team)
         db.session.commit()
         
         # Publish event
-        self.pubsub.publish_event(
+        self.pubsub.publish_event_async(
             self.tournament_id,
             'team_registered',
             {'team_id': team_id, 'name': name, 'captain': captain}
@@ -42,6 +118,37 @@ class MatchEngine:
         
         return f"Team {name} registered"
     
+    def register_next_team(self, name: str, captain: str, captain_user_id: int = None) -> str:
+        """
+        Register a team under the next free team_N id and return that id.
+        
+        Numbering continues from the highest existing team_N, since unregistered
+        teams leave gaps that make the team count collide with live ids.
+        Concurrent registrations can pick the same number; the unique
+        (team_id, tournament_id) constraint rejects the loser, which retries
+        with the following number.
+        """
+        seq = self._highest_team_number()
+        for _ in range(5):
+            seq += 1
+            team_id = f"team_{seq}"
+            try:
+                self.register_team(team_id, name, captain, captain_user_id=captain_user_id)
+                return team_id
+            except IntegrityError:
+                db.session.rollback()
+        raise ValueError('Could not allocate a team id, please try again')
+    
+    def _highest_team_number(self) -> int:
+        """Highest N among this tournament's team_N ids, or 0 if there are none."""
+        team_ids = db.session.scalars(
+            select(Team.team_id).where(
+                Team.tournament_id == self.db_id,
+                Team.team_id.like('team\\_%', escape='\\')
+            )
+        )
+        return max((int(tid[5:]) for tid in team_ids if tid[5:].isdigit()), default=0)
+    
     def unregister_team(self, team_id: str) -> bool:
         team = Team.query.filter_by(tournament_id=self.db_id, team_id=team_id).first()
         if team:
@@ -50,62 +157,125 @@ class MatchEngine:
             return True
         return False
     
+    def get_team_count(self, limit: int = None) -> int:
+        """Count registered teams; with limit, the database stops counting there."""
+        query = db.session.query(Team.id).filter_by(tournament_id=self.db_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.count()
+    
     def get_matches(self) -> List[Dict]:
-        matches = Match.query.filter_by(tournament_id=self.db_id).order_by(Match.id).all()
-        return [m.to_dict() for m in matches]
+        rows = db.session.query(
+            Match.match_id, Match.team1_id, Match.team2_id, Match.winner_id,
+            Match.status, Match.round_num, Match.is_draw,
+            Match.team1_score, Match.team2_score, Match.group_name, Match.stage,
+            Match.team1_win_probability, Match.team2_win_probability
+        ).filter(Match.tournament_id == self.db_id).order_by(Match.id)
+        return [Match.row_to_dict(row) for row in rows]
     
     def get_current_round(self) -> int:
-        return self.t_record.current_round
+        return self._current_round
     
     def set_current_round(self, round_num: int):
-        self.t_record.current_round = round_num
+        self._set_round(round_num)
         db.session.commit()
     
-    def create_single_elimination_matches(self, round_num: int = 1) -> List[Dict]:
-        teams = Team.query.filter_by(tournament_id=self.db_id).all()
+    def _set_round(self, round_num: int):
+        """Update current_round in the database and the mirror; the caller commits."""
+        # A direct UPDATE, since assigning to the expired attribute would reload the row first
+        Tournament.query.filter_by(id=self.db_id).update({Tournament.current_round: round_num})
+        self._current_round = round_num
+    
+    def _lock_current_round(self) -> int:
+        """Re-read current_round with the tournament row locked; the caller commits.
+        
+        Advancing reads the round, checks it is complete and inserts the next
+        one. Concurrent results finishing the same round serialize here, so
+        the later one sees the advanced round rather than the cached copy.
+        """
+        self._current_round = db.session.query(Tournament.current_round).filter(
+            Tournament.id == self.db_id
+        ).with_for_update().scalar()
+        return self._current_round
+    
+    def _match_row(self, match_id: str, round_num: int, team1_id: str, team2_id: str,
+                   probabilities: Tuple[float, float], stage: Optional[str] = 'knockout',
+                   group_name: str = None) -> Dict:
+        """Build a pending match row for _insert_matches."""
+        return {
+            'match_id': match_id,
+            'tournament_id': self.db_id,
+            'round_num': round_num,
+            'team1_id': team1_id,
+            'team2_id': team2_id,
+            'winner_id': None,
+            'team1_win_probability': probabilities[0],
+            'team2_win_probability': probabilities[1],
+            'group_name': group_name,
+            'stage': stage,
+            'is_draw': False,
+            'team1_score': None,
+            'team2_score': None,
+            'status': 'pending',
+        }
+    
+    def _insert_matches(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Insert match rows with a single executemany INSERT and return them as dicts.
         
+        The dicts are built from the rows themselves, which _match_row fills
+        for every serialized column, so no ORM instance is created and nothing
+        has to be re-loaded after the commit expires the session.
+        """
+        if rows:
+            db.session.execute(insert(Match), rows)
+        return [Match.row_to_dict(SimpleNamespace(**row)) for row in rows]
+    
+    def create_single_elimination_matches(self, round_num: int = 1) -> List[Dict]:
         # Sort by seeding (wins/loss or random/insertion order if new)
         # For new tournament, simple random or insertion order
-        teams.sort(key=lambda t: (t.wins * 100 - t.losses * 50), reverse=True)
+        teams = Team.query.filter_by(tournament_id=self.db_id).order_by(
+            (Team.wins * 100 - Team.losses * 50).desc(), Team.id
+        ).all()
         
-        matches_created = []
-        for i in range(0, len(teams), 2):
-            if i + 1 < len(teams):
-                match_id = generate_match_name(round_num, len(matches_created) + 1)
-                
-                # Calculate win probabilities based on ELO
-                prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
-                    teams[i].elo_rating, teams[i+1].elo_rating
-                )
-                
-                match = Match(
-                    match_id=match_id,
-                    tournament_id=self.db_id,
-                    round_num=round_num,
-                    team1_id=teams[i].team_id,
-                    team2_id=teams[i+1].team_id,
-                    team1_win_probability=prob_team1,
-                    team2_win_probability=prob_team2,
-                    status='pending'
-                )
-                db.session.add(match)
-                matches_created.append(match)
+        rows = []
+        pairs = _seeded_pairs(teams)
+        match_names = generate_match_names(round_num, len(pairs))
+        for team1, team2 in pairs:
+            match_id = match_names[len(rows)]
+            
+            if team2 is None:
+                # A bye is recorded as already won so the seed advances with the round
+                row = self._match_row(match_id, round_num, team1.team_id, None, (1.0, 0.0))
+                row.update(status='completed', winner_id=team1.team_id)
+                rows.append(row)
+                continue
+            
+            # Calculate win probabilities based on ELO
+            probabilities = self.elo_calculator.calculate_win_probability(
+                team1.elo_rating, team2.elo_rating
+            )
+            
+            rows.append(self._match_row(
+                match_id, round_num, team1.team_id, team2.team_id, probabilities
+            ))
         
-        self.t_record.current_round = round_num
+        matches_created = self._insert_matches(rows)
+        self._set_round(round_num)
         db.session.commit()
         
         # Publish event
-        self.pubsub.publish_event(
+        self.pubsub.publish_event_async(
             self.tournament_id,
             'matches_created',
             {
                 'round': round_num,
                 'match_count': len(matches_created),
-                'matches': [m.to_dict() for m in matches_created]
+                'matches': matches_created
             }
         )
         
-        return [m.to_dict() for m in matches_created]
+        return matches_created
     
     def create_round_robin_schedule(self) -> List[List[Dict]]:
         # Simplified: just create round 1 for now, or all rounds?
@@ -119,60 +289,40 @@ class MatchEngine:
         if n < 2:
             return []
         
-        if n % 2 == 1:
-            team_ids.append(None)
-            n += 1
-        
-        all_rounds_matches = []
+        rows = []
+        rounds = _circle_method_rounds(team_ids)
+        team_map = {t.team_id: t for t in teams}
         
-        # Circle method
-        for round_idx in range(n - 1):
-            round_num = round_idx + 1
-            round_matches = []
-            for i in range(n // 2):
-                t1 = team_ids[i]
-                t2 = team_ids[n - 1 - i]
+        for round_num, pairs in enumerate(rounds, 1):
+            match_names = generate_match_names(round_num, len(pairs))
+            for match_id, (t1, t2) in zip(match_names, pairs):
+                # Get team objects for ELO calculation
+                team1_obj = team_map.get(t1)
+                team2_obj = team_map.get(t2)
                 
-                if t1 is not None and t2 is not None:
-                    match_id = generate_match_name(round_num, len(round_matches) + 1)
-                    
-                    # Get team objects for ELO calculation
-                    team1_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=t1).first()
-                    team2_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=t2).first()
-                    
-                    prob_team1, prob_team2 = 0.5, 0.5
-                    if team1_obj and team2_obj:
-                        prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
-                            team1_obj.elo_rating, team2_obj.elo_rating
-                        )
-                    
-                    match = Match(
-                        match_id=match_id,
-                        tournament_id=self.db_id,
-                        round_num=round_num,
-                        team1_id=t1,
-                        team2_id=t2,
-                        team1_win_probability=prob_team1,
-                        team2_win_probability=prob_team2,
-                        status='pending'
+                prob_team1, prob_team2 = 0.5, 0.5
+                if team1_obj and team2_obj:
+                    prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
+                        team1_obj.elo_rating, team2_obj.elo_rating
                     )
-                    db.session.add(match)
-                    round_matches.append(match)
-            
-            all_rounds_matches.append(round_matches)
-            team_ids = [team_ids[0]] + [team_ids[-1]] + team_ids[1:-1]
+                
+                rows.append(self._match_row(
+                    match_id, round_num, t1, t2, (prob_team1, prob_team2)
+                ))
+        
+        matches = self._insert_matches(rows)
         
         # For MVP simple flow, we assume round 1 starts now
-        self.t_record.current_round = 1
+        self._set_round(1)
         db.session.commit()
         
         # Return nested structure for compatibility
-        return [[m.to_dict() for m in rnd] for rnd in all_rounds_matches]
+        return [[m for m in matches if m['round'] == round_num] for round_num in range(1, len(rounds) + 1)]
 
     def assign_teams_to_groups(self) -> Dict[str, List]:
         """Automatically assign teams to groups for hybrid tournaments."""
         teams = list(Team.query.filter_by(tournament_id=self.db_id).all())
-        num_groups = self.t_record.num_groups or 2
+        num_groups = self.num_groups
         
         if len(teams) < num_groups * 2:
             # Not enough teams for groups
@@ -185,11 +335,16 @@ class MatchEngine:
         group_names = [chr(65 + i) for i in range(num_groups)]  # A, B, C, D...
         
         # Distribute teams evenly across groups
-        groups = {name: [] for name in group_names}
-        for i, team in enumerate(teams):
-            group_name = group_names[i % num_groups]
-            team.group_name = group_name
-            groups[group_name].append(team)
+        groups = {name: teams[i::num_groups] for i, name in enumerate(group_names)}
+        
+        # One UPDATE per group rather than one per team on commit
+        for group_name, group_teams in groups.items():
+            db.session.execute(
+                update(Team)
+                .where(Team.id.in_([t.id for t in group_teams]))
+                .values(group_name=group_name),
+                execution_options={'synchronize_session': False}
+            )
         
         db.session.commit()
         return groups
@@ -201,8 +356,10 @@ class MatchEngine:
         # Check if teams need to be assigned to groups first
         teams_with_groups = [t for t in teams if t.group_name]
         if not teams_with_groups:
-            # Auto-assign teams to groups
+            # Auto-assign teams to groups; its commit expires the rows, so
+            # reload them together rather than one refresh per team below
             groups = self.assign_teams_to_groups()
+            teams = Team.query.filter_by(tournament_id=self.db_id).all()
         else:
             # Group teams by group_name
             groups = {}
@@ -216,74 +373,52 @@ class MatchEngine:
             # Fall back to single elimination if no groups can be formed
             return self.create_single_elimination_matches()
         
-        all_matches = []
+        rows = []
         match_counter = 0
+        team_map = {t.team_id: t for t in teams}
         
         # For each group, create round robin matches
         for group_name, group_teams in sorted(groups.items()):
             team_ids = [t.team_id for t in group_teams]
-            n = len(team_ids)
             
-            if n < 2:
+            if len(team_ids) < 2:
                 continue
             
-            # Add bye if odd number
-            if n % 2 == 1:
-                team_ids.append(None)
-                n += 1
-            
             # Circle method for round robin within group
-            for round_idx in range(n - 1):
-                round_num = round_idx + 1
-                for i in range(n // 2):
-                    t1 = team_ids[i]
-                    t2 = team_ids[n - 1 - i]
+            for round_num, pairs in enumerate(_circle_method_rounds(team_ids), 1):
+                for t1, t2 in pairs:
+                    match_counter += 1
+                    match_id = f"g{group_name}-r{round_num}-m{match_counter}"
+                    
+                    team1_obj = team_map.get(t1)
+                    team2_obj = team_map.get(t2)
                     
-                    if t1 is not None and t2 is not None:
-                        match_counter += 1
-                        match_id = f"g{group_name}-r{round_num}-m{match_counter}"
-                        
-                        team1_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=t1).first()
-                        team2_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=t2).first()
-                        
-                        prob_team1, prob_team2 = 0.5, 0.5
-                        if team1_obj and team2_obj:
-                            prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
-                                team1_obj.elo_rating, team2_obj.elo_rating
-                            )
-                        
-                        match = Match(
-                            match_id=match_id,
-                            tournament_id=self.db_id,
-                            round_num=round_num,
-                            team1_id=t1,
-                            team2_id=t2,
-                            team1_win_probability=prob_team1,
-                            team2_win_probability=prob_team2,
-                            group_name=group_name,
-                            stage='group',
-                            status='pending'
+                    prob_team1, prob_team2 = 0.5, 0.5
+                    if team1_obj and team2_obj:
+                        prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
+                            team1_obj.elo_rating, team2_obj.elo_rating
                         )
-                        db.session.add(match)
-                        all_matches.append(match)
-                
-                # Rotate for next round
-                team_ids = [team_ids[0]] + [team_ids[-1]] + team_ids[1:-1]
+                    
+                    rows.append(self._match_row(
+                        match_id, round_num, t1, t2, (prob_team1, prob_team2),
+                        stage='group', group_name=group_name
+                    ))
         
-        self.t_record.current_round = 1
+        all_matches = self._insert_matches(rows)
+        self._set_round(1)
         db.session.commit()
         
-        self.pubsub.publish_event(
+        self.pubsub.publish_event_async(
             self.tournament_id,
             'matches_created',
             {'stage': 'group', 'match_count': len(all_matches)}
         )
         
-        return [m.to_dict() for m in all_matches]
+        return all_matches
 
     def create_knockout_from_groups(self) -> List[Dict]:
         """Create knockout stage matches from group stage qualifiers."""
-        num_advance = self.t_record.teams_per_group_advance
+        num_advance = self.teams_per_group_advance
         group_standings = self.get_group_standings()
         
         qualifiers = []
@@ -295,57 +430,38 @@ class MatchEngine:
             return []
         
         # Create bracket matches with qualifiers
-        matches_created = []
-        round_num = self.t_record.current_round + 1
+        rows = []
+        round_num = self._lock_current_round() + 1
         
         # Cross-group seeding: 1A vs 2B, 1B vs 2A, etc.
         # For simplicity, just pair in order for now
-        for i in range(0, len(qualifiers), 2):
-            if i + 1 < len(qualifiers):
-                match_id = generate_match_name(round_num, len(matches_created) + 1)
-                
-                team1_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=qualifiers[i]['team_id']).first()
-                team2_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=qualifiers[i+1]['team_id']).first()
-                
-                prob_team1, prob_team2 = 0.5, 0.5
-                if team1_obj and team2_obj:
-                    prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
-                        team1_obj.elo_rating, team2_obj.elo_rating
-                    )
-                
-                match = Match(
-                    match_id=match_id,
-                    tournament_id=self.db_id,
-                    round_num=round_num,
-                    team1_id=qualifiers[i]['team_id'],
-                    team2_id=qualifiers[i+1]['team_id'],
-                    team1_win_probability=prob_team1,
-                    team2_win_probability=prob_team2,
-                    stage='knockout',
-                    status='pending'
-                )
-                db.session.add(match)
-                matches_created.append(match)
+        match_names = generate_match_names(round_num, len(qualifiers) // 2)
+        for i in range(0, len(qualifiers) - 1, 2):
+            # Standings rows already carry each qualifier's rating
+            probabilities = self.elo_calculator.calculate_win_probability(
+                qualifiers[i]['elo_rating'], qualifiers[i+1]['elo_rating']
+            )
+            
+            rows.append(self._match_row(
+                match_names[len(rows)], round_num,
+                qualifiers[i]['team_id'], qualifiers[i+1]['team_id'], probabilities
+            ))
         
-        self.t_record.current_round = round_num
+        matches_created = self._insert_matches(rows)
+        self._set_round(round_num)
         db.session.commit()
         
-        self.pubsub.publish_event(
+        self.pubsub.publish_event_async(
             self.tournament_id,
             'knockout_stage_started',
             {'round': round_num, 'match_count': len(matches_created)}
         )
         
-        return [m.to_dict() for m in matches_created]
+        return matches_created
 
     def group_stage_complete(self) -> bool:
         """Check if all group stage matches are complete."""
-        pending = Match.query.filter_by(
-            tournament_id=self.db_id,
-            stage='group',
-            status='pending'
-        ).count()
-        return pending == 0
+        return not self._has_matches(stage='group', status='pending')
 
     def record_result(self, match_id: str, winner_id: str = None, is_draw: bool = False,
                        team1_score: int = None, team2_score: int = None) -> Tuple[bool, str]:
@@ -362,7 +478,7 @@ class MatchEngine:
             return False, f"Winner {winner_id} is not in this match"
         
         # Get tournament settings
-        allow_draws = self.t_record.allow_draws
+        allow_draws = self.allow_draws
         is_knockout = match.stage == 'knockout'
         
         # Draws not allowed in knockout stages
@@ -372,34 +488,51 @@ class MatchEngine:
         if is_draw and not allow_draws:
             return False, "Draws are not enabled for this tournament"
         
+        # Claim the match atomically so concurrent submissions can't both apply a result
+        claimed = Match.query.filter_by(id=match.id, status='pending').update(
+            {'status': 'completed'}, synchronize_session=False
+        )
+        if not claimed:
+            db.session.rollback()
+            return False, f"Match {match_id} is not pending"
+        
         # Update match
         match.status = 'completed'
         match.team1_score = team1_score
         match.team2_score = team2_score
         match.is_draw = is_draw
         
-        team1 = Team.query.filter_by(tournament_id=self.db_id, team_id=match.team1_id).first()
-        team2 = Team.query.filter_by(tournament_id=self.db_id, team_id=match.team2_id).first()
+        # Lock both team rows until commit so counters and ratings aren't lost-updated;
+        # one query, locked in id order so concurrent results can't deadlock
+        locked_teams = Team.query.filter(
+            Team.tournament_id == self.db_id,
+            Team.team_id.in_([match.team1_id, match.team2_id])
+        ).order_by(Team.id).with_for_update().all()
+        teams_by_id = {t.team_id: t for t in locked_teams}
+        team1 = teams_by_id.get(match.team1_id)
+        team2 = teams_by_id.get(match.team2_id)
         
         old_team1_rating = team1.elo_rating if team1 else 1500
         old_team2_rating = team2.elo_rating if team2 else 1500
         
+        # Counters are incremented in SQL (e.g. wins = wins + 1) so the UPDATE
+        # applies on top of whatever value is committed, never a stale copy
         if is_draw:
             # Draw: both teams get 1 point
             if team1:
-                team1.draws += 1
-                team1.points += 1
+                team1.draws = Team.draws + 1
+                team1.points = Team.points + 1
                 if team1_score is not None:
-                    team1.goals_for += team1_score
+                    team1.goals_for = Team.goals_for + team1_score
                 if team2_score is not None:
-                    team1.goals_against += team2_score
+                    team1.goals_against = Team.goals_against + team2_score
             if team2:
-                team2.draws += 1
-                team2.points += 1
+                team2.draws = Team.draws + 1
+                team2.points = Team.points + 1
                 if team2_score is not None:
-                    team2.goals_for += team2_score
+                    team2.goals_for = Team.goals_for + team2_score
                 if team1_score is not None:
-                    team2.goals_against += team1_score
+                    team2.goals_against = Team.goals_against + team1_score
             
             # ELO for draw - higher rated team loses points, lower rated gains
             if team1 and team2:
@@ -440,32 +573,32 @@ class MatchEngine:
             loser = team2 if winner_id == match.team1_id else team1
             
             if winner:
-                winner.wins += 1
-                winner.points += 3  # Football: 3 points for win
+                winner.wins = Team.wins + 1
+                winner.points = Team.points + 3  # Football: 3 points for win
                 if winner_id == match.team1_id:
                     if team1_score is not None:
-                        winner.goals_for += team1_score
+                        winner.goals_for = Team.goals_for + team1_score
                     if team2_score is not None:
-                        winner.goals_against += team2_score
+                        winner.goals_against = Team.goals_against + team2_score
                 else:
                     if team2_score is not None:
-                        winner.goals_for += team2_score
+                        winner.goals_for = Team.goals_for + team2_score
                     if team1_score is not None:
-                        winner.goals_against += team1_score
+                        winner.goals_against = Team.goals_against + team1_score
             
             if loser:
-                loser.losses += 1
+                loser.losses = Team.losses + 1
                 # 0 points for loss
                 if winner_id == match.team1_id:
                     if team2_score is not None:
-                        loser.goals_for += team2_score
+                        loser.goals_for = Team.goals_for + team2_score
                     if team1_score is not None:
-                        loser.goals_against += team1_score
+                        loser.goals_against = Team.goals_against + team1_score
                 else:
                     if team1_score is not None:
-                        loser.goals_for += team1_score
+                        loser.goals_for = Team.goals_for + team1_score
                     if team2_score is not None:
-                        loser.goals_against += team2_score
+                        loser.goals_against = Team.goals_against + team2_score
             
             # Update ELO ratings
             if winner and loser:
@@ -502,7 +635,7 @@ class MatchEngine:
         db.session.commit()
         
         # Publish event
-        self.pubsub.publish_event(
+        self.pubsub.publish_event_async(
             self.tournament_id,
             'match_completed',
             {
@@ -518,52 +651,44 @@ class MatchEngine:
 
     def all_matches_complete(self, stage: str = None) -> bool:
         """Check if all matches are complete, optionally filtered by stage."""
-        query = Match.query.filter_by(
-            tournament_id=self.db_id,
-            status='pending'
-        )
-        
         if stage:
             # Check specific stage (e.g., 'knockout' for hybrid tournaments)
-            query = query.filter_by(stage=stage)
-        else:
-            # Check current round only
-            query = query.filter_by(round_num=self.t_record.current_round)
-        
-        return query.count() == 0
+            return not self._has_matches(status='pending', stage=stage)
+        # Check current round only
+        return not self._has_matches(status='pending', round_num=self._current_round)
+    
+    def _has_matches(self, **filters) -> bool:
+        """Check whether any match in this tournament matches filters (EXISTS, stops at the first row)."""
+        return db.session.query(
+            Match.query.filter_by(tournament_id=self.db_id, **filters).exists()
+        ).scalar()
     
     def knockout_stage_complete(self) -> bool:
         """Check if all knockout stage matches are complete."""
-        pending = Match.query.filter_by(
-            tournament_id=self.db_id,
-            stage='knockout',
-            status='pending'
-        ).count()
-        completed = Match.query.filter_by(
-            tournament_id=self.db_id,
-            stage='knockout',
-            status='completed'
-        ).count()
         # Complete if no pending and at least one completed
-        return pending == 0 and completed > 0
+        return (not self._has_matches(stage='knockout', status='pending')
+                and self._has_matches(stage='knockout', status='completed'))
 
     def get_tournament_winner(self) -> Optional[str]:
         # Simple standing based winner
         standings = self.get_standings()
         return standings[0]['team_id'] if standings else None
 
-    def get_standings(self, group_name: str = None) -> List[Dict]:
-        """Get standings, optionally filtered by group. Uses football-style points."""
-        query = Team.query.filter_by(tournament_id=self.db_id)
-        if group_name:
-            query = query.filter_by(group_name=group_name)
-        teams = query.all()
-        
+    def _team_rows_query(self):
+        """This tournament's teams, as the columns team dicts and standings rows read."""
+        return db.session.query(
+            Team.team_id, Team.name, Team.captain, Team.group_name,
+            Team.wins, Team.draws, Team.losses, Team.points,
+            Team.goals_for, Team.goals_against, Team.elo_rating
+        ).filter(Team.tournament_id == self.db_id)
+    
+    @staticmethod
+    def _standings_rows(teams) -> List[Dict]:
+        """Build ranked standings rows from teams already in ranking order."""
         standings = []
-        for t in teams:
+        for rank, t in enumerate(teams, start=1):
             total = t.wins + t.losses + t.draws
             win_rate = (t.wins / total * 100) if total > 0 else 0
-            goal_diff = t.goals_for - t.goals_against
             standings.append({
                 'team_id': t.team_id,
                 'name': t.name,
@@ -576,38 +701,37 @@ class MatchEngine:
                 'points': t.points,
                 'goals_for': t.goals_for,
                 'goals_against': t.goals_against,
-                'goal_difference': goal_diff,
+                'goal_difference': t.goals_for - t.goals_against,
                 'elo_rating': t.elo_rating,
-                'win_rate': round(win_rate, 1)
+                'win_rate': round(win_rate, 1),
+                'rank': rank
             })
-        
-        # Football-style sort: Points desc, Goal Diff desc, Goals For desc
-        standings.sort(key=lambda x: (x['points'], x['goal_difference'], x['goals_for']), reverse=True)
-        
-        for i, s in enumerate(standings):
-            s['rank'] = i + 1
-            
         return standings
     
+    def get_standings(self, group_name: str = None) -> List[Dict]:
+        """Get standings, optionally filtered by group. Uses football-style points."""
+        query = self._team_rows_query()
+        if group_name:
+            query = query.filter(Team.group_name == group_name)
+        return self._standings_rows(query.order_by(*_STANDINGS_ORDER).all())
+    
     def get_group_standings(self) -> Dict[str, List[Dict]]:
-        """Get standings grouped by group name."""
-        teams = Team.query.filter_by(tournament_id=self.db_id).filter(Team.group_name.isnot(None)).all()
-        groups = {}
-        
-        for t in teams:
-            if t.group_name not in groups:
-                groups[t.group_name] = []
-        
-        for group_name in groups.keys():
-            groups[group_name] = self.get_standings(group_name=group_name)
-        
-        return groups
+        """Get standings grouped by group name, from one query ordered by group then rank."""
+        teams = self._team_rows_query().filter(Team.group_name.isnot(None)).order_by(
+            Team.group_name, *_STANDINGS_ORDER
+        ).all()
+        return {
+            group_name: self._standings_rows(group_teams)
+            for group_name, group_teams in groupby(teams, key=lambda t: t.group_name)
+        }
 
     def advance_single_elimination(self, is_hybrid: bool = False) -> Tuple[bool, Optional[List[Dict]]]:
         """Advance to next round of single elimination.
         
         For hybrid tournaments, this only handles knockout stage matches.
         """
+        self._lock_current_round()
+        
         # For hybrid, only look at knockout stage matches
         if is_hybrid:
             # Get the latest knockout round with completed matches
@@ -623,31 +747,29 @@ class MatchEngine:
             current_round = knockout_matches[0].round_num
             
             # Check if current knockout round is complete
-            pending = Match.query.filter_by(
-                tournament_id=self.db_id,
-                stage='knockout',
-                round_num=current_round,
-                status='pending'
-            ).count()
+            if self._has_matches(stage='knockout', round_num=current_round, status='pending'):
+                return False, None
             
-            if pending > 0:
+            # Another result already advanced past this round
+            if self._has_matches(stage='knockout', round_num=current_round + 1):
                 return False, None
             
             current_matches = Match.query.filter_by(
                 tournament_id=self.db_id,
                 stage='knockout',
                 round_num=current_round
-            ).all()
+            ).order_by(Match.id).all()
         else:
             if not self.all_matches_complete():
                 return False, None
             
             current_matches = Match.query.filter_by(
                 tournament_id=self.db_id,
-                round_num=self.t_record.current_round
-            ).all()
-            current_round = self.t_record.current_round
+                round_num=self._current_round
+            ).order_by(Match.id).all()
+            current_round = self._current_round
         
+        # Matches come back in creation (bracket) order, so adjacent winners meet next
         winners_ids = [m.winner_id for m in current_matches if m.winner_id]
         
         if len(winners_ids) <= 1:
@@ -655,60 +777,54 @@ class MatchEngine:
             return True, None
             
         next_round = current_round + 1
-        matches_created = []
-        
-        # Determine stage for new matches
-        stage = 'knockout' if is_hybrid else None
+        rows = []
         
-        for i in range(0, len(winners_ids), 2):
-            if i + 1 < len(winners_ids):
-                match_id = generate_match_name(next_round, len(matches_created) + 1)
-                
-                team1_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=winners_ids[i]).first()
-                team2_obj = Team.query.filter_by(tournament_id=self.db_id, team_id=winners_ids[i+1]).first()
-                
-                prob_team1, prob_team2 = 0.5, 0.5
-                if team1_obj and team2_obj:
-                    prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
-                        team1_obj.elo_rating, team2_obj.elo_rating
-                    )
-                
-                match = Match(
-                    match_id=match_id,
-                    tournament_id=self.db_id,
-                    round_num=next_round,
-                    team1_id=winners_ids[i],
-                    team2_id=winners_ids[i+1],
-                    team1_win_probability=prob_team1,
-                    team2_win_probability=prob_team2,
-                    stage=stage,
-                    status='pending'
+        match_names = generate_match_names(next_round, len(winners_ids) // 2)
+        winners = {
+            t.team_id: t for t in Team.query.filter(
+                Team.tournament_id == self.db_id,
+                Team.team_id.in_(winners_ids)
+            ).all()
+        }
+        for i in range(0, len(winners_ids) - 1, 2):
+            team1_obj = winners.get(winners_ids[i])
+            team2_obj = winners.get(winners_ids[i+1])
+            
+            prob_team1, prob_team2 = 0.5, 0.5
+            if team1_obj and team2_obj:
+                prob_team1, prob_team2 = self.elo_calculator.calculate_win_probability(
+                    team1_obj.elo_rating, team2_obj.elo_rating
                 )
-                db.session.add(match)
-                matches_created.append(match)
+            
+            rows.append(self._match_row(
+                match_names[len(rows)], next_round, winners_ids[i], winners_ids[i+1],
+                (prob_team1, prob_team2)
+            ))
         
-        self.t_record.current_round = next_round
+        matches_created = self._insert_matches(rows)
+        self._set_round(next_round)
         db.session.commit()
         
-        self.pubsub.publish_event(
+        self.pubsub.publish_event_async(
             self.tournament_id,
             'round_advanced',
             {
                 'new_round': next_round,
                 'match_count': len(matches_created),
-                'matches': [m.to_dict() for m in matches_created]
+                'matches': matches_created
             }
         )
         
-        return False, [m.to_dict() for m in matches_created]
+        return False, matches_created
 
     def advance_round_robin(self) -> Tuple[bool, Optional[List[Dict]]]:
+        self._lock_current_round()
         if not self.all_matches_complete():
             return False, None
         
         # In round robin, matches are pre-generated or we just increment round.
         # Since we generated all rounds at start (or we should have), we just check if next round exists
-        next_round = self.t_record.current_round + 1
+        next_round = self._current_round + 1
         
         next_matches = Match.query.filter_by(
             tournament_id=self.db_id,
@@ -719,7 +835,7 @@ class MatchEngine:
             # No more matches, we are done
             return True, None
             
-        self.t_record.current_round = next_round
+        self._set_round(next_round)
         db.session.commit()
         
         return False, [m.to_dict() for m in next_matches]
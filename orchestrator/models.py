@@ -140,6 +140,11 @@ class Tournament(db.Model):
     teams = db.relationship('Team', back_populates='tournament', cascade='all, delete-orphan')
     matches = db.relationship('Match', back_populates='tournament', cascade='all, delete-orphan')
     
+    __table_args__ = (
+        # Keyset pagination for list_tournaments (status filter, newest id first)
+        db.Index('ix_tournament_status_id', 'status', 'id'),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -155,7 +160,7 @@ class Tournament(db.Model):
             'knockout_type': self.knockout_type,
             'teams_per_group_advance': self.teams_per_group_advance,
             'allow_draws': self.allow_draws,
-            'team_count': len(self.teams),
+            'team_count': self.team_count,
             'winner_team_id': self.winner_team_id,
             'service_url': self.service_url_prop,
             'scheduled_start': self.scheduled_start.isoformat() if self.scheduled_start else None,
@@ -200,30 +205,48 @@ class Team(db.Model):
     
     __table_args__ = (
         db.UniqueConstraint('team_id', 'tournament_id', name='unique_team_per_tournament'),
+        # Team lists by tournament and the "already a captain here?" check
+        db.Index('ix_team_tournament_captain', 'tournament_id', 'captain_user_id'),
     )
     
     def to_dict(self):
+        return Team.row_to_dict(self)
+    
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """Serialize a team from any row carrying its column attributes, e.g. a column query."""
         return {
-            'team_id': self.team_id,
-            'name': self.name,
-            'captain': self.captain,
-            'wins': self.wins,
-            'losses': self.losses,
-            'draws': self.draws,
-            'points': self.points,
-            'goals_for': self.goals_for,
-            'goals_against': self.goals_against,
-            'goal_difference': self.goals_for - self.goals_against,
-            'group': self.group_name,
-            'elo_rating': self.elo_rating,
+            'team_id': row.team_id,
+            'name': row.name,
+            'captain': row.captain,
+            'wins': row.wins,
+            'losses': row.losses,
+            'draws': row.draws,
+            'points': row.points,
+            'goals_for': row.goals_for,
+            'goals_against': row.goals_against,
+            'goal_difference': row.goals_for - row.goals_against,
+            'group': row.group_name,
+            'elo_rating': row.elo_rating,
         }
 
 
+# Deferred so plain Tournament loads skip it; list queries undefer it to get
+# counts in the same SELECT instead of loading every team row
+Tournament.team_count = db.column_property(
+    db.select(db.func.count(Team.id))
+    .where(Team.tournament_id == Tournament.id)
+    .correlate_except(Team)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
 class Match(db.Model):
     __tablename__ = 'matches'
     
     id = db.Column(db.Integer, primary_key=True)
-    match_id = db.Column(db.String(50), nullable=False, index=True)
+    match_id = db.Column(db.String(50), nullable=False)  # Indexed via unique_match_per_tournament
     tournament_id = db.Column(db.Integer, db.ForeignKey('tournaments.id'), nullable=False)
     round_num = db.Column(db.Integer, nullable=False)
     
@@ -253,23 +276,31 @@ class Match(db.Model):
     
     __table_args__ = (
         db.UniqueConstraint('match_id', 'tournament_id', name='unique_match_per_tournament'),
+        # Bracket, schedule and round lookups filter by tournament first; status
+        # lets the pending-matches-in-round check run as an index-only scan
+        db.Index('ix_match_tournament_round_status', 'tournament_id', 'round_num', 'status'),
     )
 
     def to_dict(self):
+        return Match.row_to_dict(self)
+    
+    @staticmethod
+    def row_to_dict(row) -> dict:
+        """Serialize a match from any row carrying its column attributes, e.g. a column query."""
         return {
-            'id': self.match_id,
-            'team1': self.team1_id,
-            'team2': self.team2_id,
-            'winner': self.winner_id,
-            'status': self.status,
-            'round': self.round_num,
-            'is_draw': self.is_draw,
-            'team1_score': self.team1_score,
-            'team2_score': self.team2_score,
-            'group': self.group_name,
-            'stage': self.stage,
-            'team1_win_probability': self.team1_win_probability,
-            'team2_win_probability': self.team2_win_probability,
+            'id': row.match_id,
+            'team1': row.team1_id,
+            'team2': row.team2_id,
+            'winner': row.winner_id,
+            'status': row.status,
+            'round': row.round_num,
+            'is_draw': row.is_draw,
+            'team1_score': row.team1_score,
+            'team2_score': row.team2_score,
+            'group': row.group_name,
+            'stage': row.stage,
+            'team1_win_probability': row.team1_win_probability,
+            'team2_win_probability': row.team2_win_probability,
         }
 
 
@@ -304,3 +335,30 @@ class Subscription(db.Model):
     __table_args__ = (
         db.UniqueConstraint('user_id', 'tournament_id', name='unique_subscription'),
     )
+
+
+# Indexes earlier versions of the models created and the current ones no
+# longer declare
+RETIRED_INDEXES = (
+    'ix_matches_match_id',  # Covered by unique_match_per_tournament
+)
+
+
+def create_schema():
+    """Create missing tables, then sync indexes on the tables that already existed."""
+    db.create_all()
+    sync_indexes()
+
+
+def sync_indexes():
+    """Bring indexes on existing tables in line with the models.
+    
+    create_all() skips tables that already exist, and with them any index
+    added to the model since, so create_schema runs this after it.
+    """
+    with db.engine.begin() as conn:
+        for name in RETIRED_INDEXES:
+            conn.execute(db.text(f'DROP INDEX IF EXISTS {name}'))
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
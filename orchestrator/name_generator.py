@@ -1,4 +1,5 @@
 import random
+from typing import List
 
 # Curated word lists for generating friendly names
 ADJECTIVES = [
@@ -33,10 +34,16 @@ def generate_tournament_name() -> str:
 
 def generate_match_name(round_num: int, match_num: int) -> str:
     """Generate a friendly match name like 'r2-steel-dragon-duel'"""
-    adj = random.choice(ADJECTIVES)
-    noun = random.choice(NOUNS)
-    descriptor = random.choice(MATCH_DESCRIPTORS)
-    return f"r{round_num}-{adj}-{noun}-{descriptor}"
+    return generate_match_names(round_num, 1)[0]
+
+def generate_match_names(round_num: int, count: int) -> List[str]:
+    """Generate `count` distinct match names for one round (sampled, so no collisions)"""
+    names = []
+    for idx in random.sample(range(len(ADJECTIVES) * len(NOUNS) * len(MATCH_DESCRIPTORS)), count):
+        idx, descriptor = divmod(idx, len(MATCH_DESCRIPTORS))
+        adj, noun = divmod(idx, len(NOUNS))
+        names.append(f"r{round_num}-{ADJECTIVES[adj]}-{NOUNS[noun]}-{MATCH_DESCRIPTORS[descriptor]}")
+    return names
 
 def generate_short_id(prefix: str = "") -> str:
     """Generate a short random ID for uniqueness (fallback)"""
@@ -1,5 +1,7 @@
 import os
-import json
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Callable, Dict, Any
 from google.cloud import pubsub_v1
@@ -21,10 +23,13 @@ class PubSubManager:
         if not self.is_local:
             self.publisher = pubsub_v1.PublisherClient()
             self.subscriber = pubsub_v1.SubscriberClient()
+            # Single worker keeps events in the order they were queued
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pubsub')
         else:
             # Local development mode - no actual Pub/Sub
             self.publisher = None
             self.subscriber = None
+            self._executor = None
             logger.info("PubSubManager running in local development mode (no actual Pub/Sub)")
     
     def get_topic_path(self, tournament_id: str) -> str:
@@ -137,7 +142,7 @@ class PubSubManager:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            message_bytes = json.dumps(message_data).encode('utf-8')
+            message_bytes = orjson.dumps(message_data)
             
             # Publish with retry
             future = self.publisher.publish(
@@ -154,6 +159,24 @@ class PubSubManager:
             logger.error(f"Failed to publish event {event_type} for {tournament_id}: {e}")
             return None
     
+    def publish_event_async(
+        self,
+        tournament_id: str,
+        event_type: str,
+        data: Dict[str, Any]
+    ) -> None:
+        """
+        Queue an event for publishing without blocking the caller.
+        
+        publish_event waits on the topic check and the publish round-trip,
+        so request handlers hand it to a background worker instead.
+        Failures are logged by publish_event.
+        """
+        if self._executor is None:
+            self.publish_event(tournament_id, event_type, data)
+            return
+        self._executor.submit(self.publish_event, tournament_id, event_type, data)
+    
     def pull_messages(
         self, 
         tournament_id: str, 
@@ -190,7 +213,7 @@ class PubSubManager:
             
             for received_message in response.received_messages:
                 try:
-                    data = json.loads(received_message.message.data.decode('utf-8'))
+                    data = orjson.loads(received_message.message.data)
                     messages.append(data)
                     ack_ids.append(received_message.ack_id)
                 except Exception as e:
@@ -242,10 +265,15 @@ class PubSubManager:
 
 # Global instance
 _pubsub_manager = None
+_pubsub_manager_lock = threading.Lock()
 
 def get_pubsub_manager() -> PubSubManager:
     """Get or create the global PubSubManager instance."""
     global _pubsub_manager
     if _pubsub_manager is None:
-        _pubsub_manager = PubSubManager()
+        # Request threads can race here on first use; only one may build the
+        # clients and publish executor
+        with _pubsub_manager_lock:
+            if _pubsub_manager is None:
+                _pubsub_manager = PubSubManager()
     return _pubsub_manager
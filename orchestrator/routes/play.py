@@ -21,11 +21,12 @@ def admin_required(f):
 
 bp = Blueprint('play', __name__)
 
-def get_match_engine(tournament_id):
-    return MatchEngine(tournament_id)
+def get_match_engine(tournament_id, t=None):
+    return MatchEngine(tournament_id, t_record=t)
 
-def get_state_machine(tournament_id):
-    t = Tournament.query.filter_by(tournament_id=tournament_id).first()
+def get_state_machine(tournament_id, t=None):
+    if t is None:
+        t = Tournament.query.filter_by(tournament_id=tournament_id).first()
     if not t:
         return TournamentStateMachine(TournamentState.REGISTRATION)
     
@@ -34,15 +35,16 @@ def get_state_machine(tournament_id):
     # The state machine uses: 'registration', 'active', 'completed'
     return TournamentStateMachine.from_state_string(t.status)
 
-def save_state(tournament_id, sm):
-    t = Tournament.query.filter_by(tournament_id=tournament_id).first()
+def save_state(tournament_id, sm, t=None):
+    if t is None:
+        t = Tournament.query.filter_by(tournament_id=tournament_id).first()
     if t:
         t.status = sm.state.value
         db.session.commit()
 
-def advance_tournament(tournament_id, tournament_type):
-    sm = get_state_machine(tournament_id)
-    match_engine = get_match_engine(tournament_id)
+def advance_tournament(tournament_id, tournament_type, t=None, match_engine=None):
+    if match_engine is None:
+        match_engine = get_match_engine(tournament_id, t)
     
     if tournament_type == 'round_robin':
         is_complete, next_matches = match_engine.advance_round_robin()
@@ -54,8 +56,9 @@ def advance_tournament(tournament_id, tournament_type):
     
     if is_complete:
         match_engine.get_tournament_winner()
+        sm = get_state_machine(tournament_id, t)
         sm.transition('complete')
-        save_state(tournament_id, sm)
+        save_state(tournament_id, sm, t)
 
 # --- Routes ---
 
@@ -72,8 +75,7 @@ def list_view(tournament_id):
     if not t:
         return render_template('404.html'), 404
         
-    sm = get_state_machine(tournament_id)
-    match_engine = get_match_engine(tournament_id)
+    sm = get_state_machine(tournament_id, t)
     
     return render_template('results_form.html',
         tournament_id=tournament_id,
@@ -90,8 +92,8 @@ def get_state(tournament_id):
     if not t:
         return jsonify({'error': 'Not found'}), 404
         
-    sm = get_state_machine(tournament_id)
-    match_engine = get_match_engine(tournament_id)
+    sm = get_state_machine(tournament_id, t)
+    match_engine = get_match_engine(tournament_id, t)
     
     return jsonify({
         'tournament_id': tournament_id,
@@ -119,14 +121,16 @@ def register_team(tournament_id):
     if not t:
         return jsonify({'error': 'Tournament not found'}), 404
     
-    sm = get_state_machine(tournament_id)
-    match_engine = get_match_engine(tournament_id)
+    sm = get_state_machine(tournament_id, t)
+    match_engine = get_match_engine(tournament_id, t)
     
     if not sm.can_perform('register_team'):
         return jsonify({'error': f'Cannot register teams in {sm.state.value} state'}), 400
     
     # Check if tournament is full
-    if len(match_engine.get_teams()) >= t.max_teams:
+    # Counting stops at max_teams, since only the cap matters here
+    team_count = match_engine.get_team_count(limit=t.max_teams)
+    if team_count >= t.max_teams:
         return jsonify({'error': 'Tournament is full'}), 400
     
     # Check if user already has a team in this tournament
@@ -134,24 +138,16 @@ def register_team(tournament_id):
     if existing_team:
         return jsonify({'error': f'You already have a team in this tournament: {existing_team.name}'}), 400
     
-    data = request.json or {}
+    data = request.get_json(silent=True) or {}
     name = data.get('name', '').strip()
     captain = data.get('captain', '').strip() or current_user.display_name
     
     if not name:
         return jsonify({'error': 'Team name is required'}), 400
     
-    # Generate team_id
-    team_id = f"team_{len(match_engine.get_teams()) + 1}"
-    
     try:
-        match_engine.register_team(team_id, name, captain)
-        
-        # Link current user as captain
-        team = Team.query.filter_by(tournament_id=t.id, team_id=team_id).first()
-        if team:
-            team.captain_user_id = current_user.id
-            db.session.commit()
+        # Link current user as captain in the same insert; team_id is allocated race-free
+        team_id = match_engine.register_next_team(name, captain, captain_user_id=current_user.id)
         
         return jsonify({
             'team_id': team_id, 
@@ -170,8 +166,12 @@ def get_matches(tournament_id):
 @bp.route('/api/v1/play/<tournament_id>/matches/<match_id>/result', methods=['POST'])
 @admin_required
 def record_result(tournament_id, match_id):
-    sm = get_state_machine(tournament_id)
-    match_engine = get_match_engine(tournament_id)
+    t = Tournament.query.filter_by(tournament_id=tournament_id).first()
+    if not t:
+        return jsonify({'error': 'Tournament not found'}), 404
+    
+    sm = get_state_machine(tournament_id, t)
+    match_engine = get_match_engine(tournament_id, t)
     
     if not sm.can_perform('record_result'):
         return jsonify({
@@ -179,7 +179,7 @@ def record_result(tournament_id, match_id):
             'state': sm.state.value
         }), 400
     
-    data = request.json
+    data = request.get_json(silent=True) or {}
     winner = data.get('winner')
     is_draw = data.get('is_draw', False)
     team1_score = data.get('team1_score')
@@ -189,6 +189,9 @@ def record_result(tournament_id, match_id):
     if not winner and not is_draw:
         return jsonify({'error': 'Winner or is_draw is required'}), 400
     
+    # Read before record_result commits and expires the row
+    tournament_type = t.tournament_type
+    
     success, message = match_engine.record_result(
         match_id, 
         winner_id=winner, 
@@ -200,32 +203,10 @@ def record_result(tournament_id, match_id):
     if not success:
         return jsonify({'error': message}), 400
     
-    # Check for advancement
-    t = Tournament.query.filter_by(tournament_id=tournament_id).first()
-    
-    if t.tournament_type == 'hybrid':
-        # For hybrid tournaments:
-        # - Group stage: just record results, accumulate points (no auto-advancement)
-        # - Knockout stage: advance like single elimination
-        match = Match.query.filter_by(tournament_id=t.id, match_id=match_id).first()
-        
-        if match and match.stage == 'knockout':
-            # Check if current knockout round is complete
-            current_round = match.round_num
-            pending_in_round = Match.query.filter_by(
-                tournament_id=t.id,
-                stage='knockout',
-                round_num=current_round,
-                status='pending'
-            ).count()
-            
-            if pending_in_round == 0:
-                # Advance to next knockout round (pass 'hybrid' to use is_hybrid=True)
-                advance_tournament(tournament_id, 'hybrid')
-        # Group stage: no auto-advancement, wait for explicit advance-to-knockout call
-        # Points are already recorded, just return success
-    elif match_engine.all_matches_complete():
-        advance_tournament(tournament_id, t.tournament_type)
+    # Check for advancement. The advance_* methods run the round-completion
+    # check themselves and no-op until the round is done; hybrid group results
+    # never advance here since no knockout round exists yet (see advance-to-knockout).
+    advance_tournament(tournament_id, tournament_type, t, match_engine=match_engine)
     
     return jsonify({
         'message': message, 
@@ -237,19 +218,22 @@ def record_result(tournament_id, match_id):
 @bp.route('/api/v1/play/<tournament_id>/start', methods=['POST'])
 @admin_required
 def start_tournament(tournament_id):
-    sm = get_state_machine(tournament_id)
-    match_engine = get_match_engine(tournament_id)
-    
     t = Tournament.query.filter_by(tournament_id=tournament_id).first()
     if not t:
         return jsonify({'error': 'Tournament not found'}), 404
-        
+    
+    sm = get_state_machine(tournament_id, t)
+    match_engine = get_match_engine(tournament_id, t)
+    
     teams = match_engine.get_teams()
     
+    # Read settings now; the commits below expire the row
+    tournament_type = t.tournament_type
+    
     # Determine minimum teams based on tournament type
-    if t.tournament_type == 'single_elimination':
+    if tournament_type == 'single_elimination':
         min_teams = 4
-    elif t.tournament_type == 'hybrid':
+    elif tournament_type == 'hybrid':
         # Hybrid needs at least 2 teams per group
         min_teams = max(4, (t.num_groups or 2) * 2)
     else:
@@ -260,27 +244,27 @@ def start_tournament(tournament_id):
     
     try:
         sm.transition('start')
-        save_state(tournament_id, sm)
+        save_state(tournament_id, sm, t)
         
         # Ensure Pub/Sub topic and subscription exist
         pubsub = get_pubsub_manager()
         pubsub.ensure_topic_exists(tournament_id)
         pubsub.ensure_subscription_exists(tournament_id)
         
-        if t.tournament_type == 'round_robin':
+        if tournament_type == 'round_robin':
             matches = match_engine.create_round_robin_schedule()
             first_round = matches[0] if matches else []
-        elif t.tournament_type == 'hybrid':
+        elif tournament_type == 'hybrid':
             # Hybrid: create group stage matches first
             first_round = match_engine.create_group_stage_matches()
         else:
             first_round = match_engine.create_single_elimination_matches()
         
         # Publish tournament started event
-        pubsub.publish_event(
+        pubsub.publish_event_async(
             tournament_id,
             'tournament_started',
-            {'match_count': len(first_round), 'tournament_type': t.tournament_type}
+            {'match_count': len(first_round), 'tournament_type': tournament_type}
         )
         
         return jsonify({
@@ -311,8 +295,6 @@ def get_stage_status(tournament_id):
     if not t:
         return jsonify({'error': 'Tournament not found'}), 404
     
-    match_engine = get_match_engine(tournament_id)
-    
     # Count matches by stage
     group_matches = Match.query.filter_by(tournament_id=t.id, stage='group').all()
     knockout_matches = Match.query.filter_by(tournament_id=t.id, stage='knockout').all()
@@ -360,15 +342,14 @@ def advance_to_knockout(tournament_id):
     if t.tournament_type != 'hybrid':
         return jsonify({'error': 'Only hybrid tournaments can advance to knockout'}), 400
     
-    match_engine = get_match_engine(tournament_id)
+    match_engine = get_match_engine(tournament_id, t)
     
     # Check if group stage is complete
     if not match_engine.group_stage_complete():
         return jsonify({'error': 'Group stage is not complete yet'}), 400
     
     # Check if knockout already generated
-    existing_knockout = Match.query.filter_by(tournament_id=t.id, stage='knockout').count()
-    if existing_knockout > 0:
+    if db.session.query(Match.query.filter_by(tournament_id=t.id, stage='knockout').exists()).scalar():
         return jsonify({'error': 'Knockout stage already generated'}), 400
     
     # Create knockout matches
@@ -396,15 +377,23 @@ def get_team_detail(tournament_id, team_id):
         ((Match.team1_id == team_id) | (Match.team2_id == team_id))
     ).order_by(Match.created_at.desc()).all()
     
+    # Resolve all opponent names with one IN query
+    opponent_ids = {m.team2_id if m.team1_id == team_id else m.team1_id for m in matches}
+    opponent_ids.discard(None)  # Byes have no opponent
+    opponent_names = dict(
+        db.session.query(Team.team_id, Team.name)
+        .filter(Team.tournament_id == t.id, Team.team_id.in_(opponent_ids))
+        .all()
+    ) if opponent_ids else {}
+    
     match_history = []
     for m in matches:
         opponent_id = m.team2_id if m.team1_id == team_id else m.team1_id
-        opponent = Team.query.filter_by(tournament_id=t.id, team_id=opponent_id).first()
         
         match_history.append({
             'match_id': m.match_id,
             'round': m.round_num,
-            'opponent': opponent.name if opponent else opponent_id,
+            'opponent': 'BYE' if opponent_id is None else opponent_names.get(opponent_id, opponent_id),
             'opponent_id': opponent_id,
             'result': 'win' if m.winner_id == team_id else 'loss' if m.winner_id else 'pending',
             'status': m.status,
@@ -472,6 +461,10 @@ def tournament_events_stream(tournament_id):
     if not t:
         return jsonify({'error': 'Tournament not found'}), 404
     
+    # stream_with_context defers teardown until the stream ends; hand the
+    # pooled connection back now instead of pinning it for the whole stream
+    db.session.close()
+    
     def event_stream():
         yield f"data: {json.dumps({'event_type': 'connected', 'tournament_id': tournament_id})}\n\n"
         # Keepalive only - clients poll /api/v1/play/<id>/bracket for actual updates
@@ -1,4 +1,6 @@
 from typing import List, Set
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from .models import db, Subscription
 
 
@@ -19,29 +21,25 @@ class SubscriptionManager:
         notify_on_match: bool = True,
         notify_on_complete: bool = True
     ) -> bool:
-        """Subscribe a user to a tournament."""
-        # Check if already subscribed
-        existing = Subscription.query.filter_by(
+        """Subscribe a user to a tournament (or update preferences if already subscribed)."""
+        # Single upsert instead of SELECT followed by UPDATE/INSERT
+        insert = sqlite_insert if db.engine.dialect.name == 'sqlite' else pg_insert
+        stmt = insert(Subscription).values(
             user_id=user_id,
-            tournament_id=tournament_id
-        ).first()
-        
-        if existing:
-            # Update preferences
-            existing.notify_on_start = notify_on_start
-            existing.notify_on_match = notify_on_match
-            existing.notify_on_complete = notify_on_complete
-        else:
-            # Create new subscription
-            sub = Subscription(
-                user_id=user_id,
-                tournament_id=tournament_id,
-                notify_on_start=notify_on_start,
-                notify_on_match=notify_on_match,
-                notify_on_complete=notify_on_complete
-            )
-            db.session.add(sub)
-        
+            tournament_id=tournament_id,
+            notify_on_start=notify_on_start,
+            notify_on_match=notify_on_match,
+            notify_on_complete=notify_on_complete
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['user_id', 'tournament_id'],
+            set_={
+                'notify_on_start': stmt.excluded.notify_on_start,
+                'notify_on_match': stmt.excluded.notify_on_match,
+                'notify_on_complete': stmt.excluded.notify_on_complete,
+            }
+        )
+        db.session.execute(stmt)
         db.session.commit()
         return True
     
@@ -60,13 +58,13 @@ class SubscriptionManager:
     
     def get_user_subscriptions(self, user_id: str) -> List[str]:
         """Get all tournament IDs a user is subscribed to."""
-        subs = Subscription.query.filter_by(user_id=user_id).all()
-        return [s.tournament_id for s in subs]
+        rows = db.session.query(Subscription.tournament_id).filter_by(user_id=user_id).all()
+        return [tournament_id for (tournament_id,) in rows]
     
     def get_tournament_subscribers(self, tournament_id: str) -> List[str]:
         """Get all user IDs subscribed to a tournament."""
-        subs = Subscription.query.filter_by(tournament_id=tournament_id).all()
-        return [s.user_id for s in subs]
+        rows = db.session.query(Subscription.user_id).filter_by(tournament_id=tournament_id).all()
+        return [user_id for (user_id,) in rows]
     
     def is_subscribed(self, user_id: str, tournament_id: str) -> bool:
         """Check if a user is subscribed to a tournament."""
@@ -1,4 +1,5 @@
 from typing import Optional, Tuple, List
+from sqlalchemy.orm import joinedload, undefer
 
 from .models import db, Tournament, Team
 from .name_generator import generate_tournament_name, generate_short_id
@@ -65,19 +66,44 @@ class TournamentRegistry:
         """Get tournament by its public ID."""
         return Tournament.query.filter_by(tournament_id=tournament_id).first()
     
+    def get_tournament_with_teams(self, tournament_id: str) -> Optional[Tournament]:
+        """Get tournament by its public ID with its teams loaded in the same query."""
+        return Tournament.query.options(joinedload(Tournament.teams)).filter_by(
+            tournament_id=tournament_id
+        ).first()
+    
+    def get_tournaments_bulk(self, tournament_ids: List[str]) -> List[Tournament]:
+        """Get tournaments by public ID in one query, keeping the given order."""
+        if not tournament_ids:
+            return []
+        rows = Tournament.query.filter(Tournament.tournament_id.in_(tournament_ids)).all()
+        by_id = {t.tournament_id: t for t in rows}
+        return [by_id[tid] for tid in tournament_ids if tid in by_id]
+    
     def list_tournaments(
         self,
         status: str = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: int = None
     ) -> List[Tournament]:
-        """List tournaments with optional filtering."""
-        query = Tournament.query
+        """
+        List tournaments with optional filtering, newest first.
+        
+        Pass cursor (the id of the last tournament on the previous page) for
+        keyset pagination; offset is kept for existing callers.
+        """
+        # Every list consumer shows team counts; select them in the same query
+        query = Tournament.query.options(undefer(Tournament.team_count))
         
         if status:
             query = query.filter_by(status=status)
         
-        query = query.order_by(Tournament.created_at.desc())
+        if cursor is not None:
+            query = query.filter(Tournament.id < cursor)
+        
+        # Ids are assigned in creation order, so this matches created_at desc
+        query = query.order_by(Tournament.id.desc())
         return query.offset(offset).limit(limit).all()
     
     def publish_tournament(self, tournament_id: str) -> Tuple[bool, str]:
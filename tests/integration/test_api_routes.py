@@ -4,6 +4,7 @@ Tests all endpoints in the play blueprint and main app routes.
 """
 import pytest
 import json
+import re
 
 
 class TestHealthEndpoint:
@@ -17,6 +18,89 @@ class TestHealthEndpoint:
         data = json.loads(response.data)
         assert 'status' in data
         assert 'database' in data
+    
+    def test_health_check_caches_database_probe(self, mocker):
+        """Checks within HEALTH_CACHE_SECONDS should share one database probe."""
+        from orchestrator.app import create_app
+        probe = mocker.patch('orchestrator.app._probe_database', return_value={
+            'connected': True, 'latency_ms': 0.5, 'error': None
+        })
+        client = create_app('testing').test_client()
+        
+        assert client.get('/health').status_code == 200
+        assert client.get('/health').status_code == 200
+        assert probe.call_count == 1
+    
+    def test_health_check_probes_again_after_cache_expires(self, mocker):
+        """A stale cached probe should be replaced by a fresh one."""
+        from orchestrator.app import create_app
+        mocker.patch('orchestrator.app.HEALTH_CACHE_SECONDS', 0)
+        probe = mocker.patch('orchestrator.app._probe_database', return_value={
+            'connected': False, 'latency_ms': None, 'error': 'down'
+        })
+        client = create_app('testing').test_client()
+        
+        assert client.get('/health').status_code == 503
+        assert client.get('/health').status_code == 503
+        assert probe.call_count == 2
+    
+    def test_health_check_reports_pool_counters(self, mocker, tmp_path):
+        """A queue pool reports its size and checkout counters."""
+        from orchestrator.app import create_app
+        from orchestrator.config import TestingConfig
+        mocker.patch.object(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{tmp_path / "health.db"}')
+        client = create_app('testing').test_client()
+        
+        data = json.loads(client.get('/health').data)
+        
+        assert set(data['database']['pool']) == {'size', 'checked_out', 'checked_in', 'overflow'}
+    
+    def test_health_check_pool_is_null_without_counters(self, client):
+        """The in-memory SQLite static pool has no counters to report."""
+        data = json.loads(client.get('/health').data)
+        assert data['database']['pool'] is None
+
+
+class TestInitDbCommand:
+    """Tests for the flask init-db CLI command."""
+    
+    def test_init_db_creates_tables(self, app):
+        """init-db should run create_all and report success."""
+        result = app.test_cli_runner().invoke(args=['init-db'])
+        assert result.exit_code == 0
+        assert 'Database tables created' in result.output
+    
+    def test_init_db_syncs_indexes_on_existing_tables(self, app):
+        """init-db should add new model indexes and drop retired ones."""
+        from sqlalchemy import inspect
+        from orchestrator.models import db
+        
+        with app.app_context():
+            with db.engine.begin() as conn:
+                conn.execute(db.text('DROP INDEX ix_team_tournament_captain'))
+                conn.execute(db.text('CREATE INDEX ix_matches_match_id ON matches (match_id)'))
+        
+        result = app.test_cli_runner().invoke(args=['init-db'])
+        assert result.exit_code == 0
+        
+        with app.app_context():
+            inspector = inspect(db.engine)
+            team_indexes = {ix['name'] for ix in inspector.get_indexes('teams')}
+            match_indexes = {ix['name'] for ix in inspector.get_indexes('matches')}
+        assert 'ix_team_tournament_captain' in team_indexes
+        assert 'ix_matches_match_id' not in match_indexes
+
+
+class TestAuthLogin:
+    """Tests for /api/v1/auth/login endpoint."""
+    
+    def test_login_assigns_hex_display_name(self, client, db_session):
+        """New players get a Player_ name with a hex suffix."""
+        response = client.post('/api/v1/auth/login', json={'username': 'alice'})
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert re.fullmatch(r'Player_[0-9a-f]{6}', data['user']['display_name'])
 
 
 class TestTournamentCRUD:
@@ -70,6 +154,16 @@ class TestTournamentCRUD:
         data = json.loads(response.data)
         assert data['tournament_id'] == sample_tournament.tournament_id
     
+    def test_get_tournament_not_modified(self, client, sample_tournament):
+        """GET /api/v1/tournaments/{id} with a matching ETag should 304."""
+        url = f'/api/v1/tournaments/{sample_tournament.tournament_id}'
+        first = client.get(url)
+        etag = first.headers['ETag']
+        
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+    
     def test_get_tournament_not_found(self, client):
         """GET /api/v1/tournaments/{id} with invalid ID should 404."""
         response = client.get('/api/v1/tournaments/nonexistent')
@@ -152,6 +246,24 @@ class TestTeamRegistration:
         assert response.status_code == 200
         data = json.loads(response.data)
         assert len(data) == len(sample_teams)
+    
+    def test_list_teams_not_modified(self, client, sample_tournament, sample_teams):
+        """GET /api/v1/tournaments/{id}/teams with a matching ETag should 304 until a team changes."""
+        from orchestrator.models import db, Team
+        url = f'/api/v1/tournaments/{sample_tournament.tournament_id}/teams'
+        first = client.get(url)
+        etag = first.headers['ETag']
+        
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        
+        Team.query.filter_by(team_id=sample_teams[0].team_id).first().name = 'Renamed'
+        db.session.commit()
+        
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
 
 
 class TestMatchOperations:
@@ -337,6 +449,26 @@ class TestTeamDetailEndpoint:
         assert 'match_history' in data
         assert 'elo_history' in data
     
+    def test_get_team_detail_marks_byes(self, client, sample_tournament, sample_teams):
+        """A bye match should list BYE as the opponent."""
+        from orchestrator.models import db, Match
+        db.session.add(Match(
+            match_id='r1-bye', tournament_id=sample_tournament.id, round_num=1,
+            team1_id=sample_teams[0].team_id, team2_id=None,
+            winner_id=sample_teams[0].team_id, status='completed'
+        ))
+        db.session.commit()
+        
+        response = client.get(
+            f'/api/v1/play/{sample_tournament.tournament_id}/teams/{sample_teams[0].team_id}'
+        )
+        
+        assert response.status_code == 200
+        history = json.loads(response.data)['match_history']
+        assert history[0]['opponent'] == 'BYE'
+        assert history[0]['opponent_id'] is None
+        assert history[0]['result'] == 'win'
+    
     def test_get_team_detail_not_found(self, client, sample_tournament):
         """GET with invalid team ID should 404."""
         response = client.get(
@@ -249,6 +249,35 @@ class TestGetRatingChangeAmount:
         assert isinstance(loser_change, int)
 
 
+class TestRatingDifferenceCap:
+    """Tests for the FIDE 400-point cap on rating differences."""
+    
+    @pytest.fixture
+    def calc(self):
+        return EloCalculator()
+    
+    def test_rating_change_capped_at_400(self, calc):
+        """Gaps beyond 400 points should change ratings as if they were 400."""
+        assert calc.get_rating_change_amount(2400, 800) == calc.get_rating_change_amount(1900, 1500)
+        assert calc.get_rating_change_amount(800, 2400) == calc.get_rating_change_amount(1500, 1900)
+    
+    def test_draw_change_capped_at_400(self, calc):
+        """Draw changes should use the capped gap as well."""
+        assert calc.get_draw_change_amount(2400, 800) == calc.get_draw_change_amount(1900, 1500)
+    
+    def test_gap_within_cap_unchanged(self, calc):
+        """Gaps up to 400 points should use the plain ELO formula."""
+        expected_winner = 1 / (1 + math.pow(10, (1400 - 1700) / 400))
+        winner_change, _ = calc.get_rating_change_amount(1700, 1400)
+        assert winner_change == round(32 * (1 - expected_winner))
+    
+    def test_win_probability_not_capped(self, calc):
+        """Match predictions should still use the full rating gap."""
+        prob_far, _ = calc.calculate_win_probability(2400, 800)
+        prob_cap, _ = calc.calculate_win_probability(1900, 1500)
+        assert prob_far > prob_cap
+
+
 class TestEloCalculatorEdgeCases:
     """Edge case tests for EloCalculator."""
     
@@ -0,0 +1,224 @@
+"""
+Unit tests for MatchEngine class.
+Tests: team and match listings, team registration, bracket seeding, result recording, round advancement
+"""
+import pytest
+from orchestrator.match_engine import MatchEngine, _seeded_pairs
+from orchestrator.models import db, Match, Team, EloHistory
+
+
+def complete_round(tournament_db_id, round_num):
+    """Mark every match in a round completed with team1 winning."""
+    for match in Match.query.filter_by(tournament_id=tournament_db_id, round_num=round_num):
+        match.status = 'completed'
+        match.winner_id = match.team1_id
+    db.session.commit()
+
+
+class TestListings:
+    """Tests for get_teams and get_matches methods."""
+    
+    def test_get_teams_matches_to_dict(self, app, sample_tournament, sample_teams, mock_pubsub):
+        """Team listings serialize the same as the model."""
+        with app.app_context():
+            teams = MatchEngine(sample_tournament.tournament_id).get_teams()
+            assert teams == {t.team_id: t.to_dict() for t in Team.query.all()}
+    
+    def test_get_matches_matches_to_dict(self, app, sample_tournament, sample_match, mock_pubsub):
+        """Match listings serialize the same as the model."""
+        with app.app_context():
+            matches = MatchEngine(sample_tournament.tournament_id).get_matches()
+            assert matches == [Match.query.filter_by(match_id='test-match-001').one().to_dict()]
+    
+    def test_listings_see_unflushed_changes(self, app, sample_tournament, sample_match, mock_pubsub):
+        """Pending session changes are flushed before listing."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            Team.query.filter_by(team_id='team-1').one().name = 'Renamed'
+            Match.query.filter_by(match_id='test-match-001').one().status = 'abandoned'
+            
+            assert engine.get_teams()['team-1']['name'] == 'Renamed'
+            assert engine.get_matches()[0]['status'] == 'abandoned'
+
+
+class TestRegisterNextTeam:
+    """Tests for register_next_team method."""
+    
+    def test_numbers_from_one(self, app, sample_tournament, mock_pubsub):
+        """The first team gets team_1."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            assert engine.register_next_team('Alpha', 'Captain A') == 'team_1'
+    
+    def test_continues_after_unregistered_teams(self, app, sample_tournament, mock_pubsub):
+        """Gaps left by unregistered teams do not collide with live ids."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            for i in range(10):
+                engine.register_next_team(f'Team {i+1}', f'Captain {i+1}')
+            for i in range(5):
+                engine.unregister_team(f'team_{i+1}')
+            
+            assert engine.register_next_team('Late', 'Captain L') == 'team_11'
+    
+    def test_retries_when_id_is_taken(self, app, sample_tournament, mock_pubsub, mocker):
+        """A concurrent insert of the same id makes it retry with the next number."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            engine.register_next_team('Alpha', 'Captain A')
+            engine.register_next_team('Beta', 'Captain B')
+            # Simulate a racing request that read the highest number before team_2 existed
+            mocker.patch.object(engine, '_highest_team_number', return_value=1)
+            
+            assert engine.register_next_team('Gamma', 'Captain C') == 'team_3'
+            assert Team.query.filter_by(tournament_id=sample_tournament.id).count() == 3
+
+
+class TestSeededPairs:
+    """Tests for _seeded_pairs bracket seeding."""
+    
+    def test_four_teams(self):
+        """1 plays 4 and 2 plays 3."""
+        assert _seeded_pairs([1, 2, 3, 4]) == [(1, 4), (2, 3)]
+    
+    def test_eight_teams_in_bracket_order(self):
+        """Top seeds land in opposite halves of the bracket."""
+        assert _seeded_pairs(list(range(1, 9))) == [(1, 8), (4, 5), (2, 7), (3, 6)]
+    
+    def test_non_power_of_two_gives_top_seeds_byes(self):
+        """Twelve teams fill a 16 bracket with byes for seeds 1-4."""
+        assert _seeded_pairs(list(range(1, 13))) == [
+            (1, None), (8, 9), (4, None), (5, 12),
+            (2, None), (7, 10), (3, None), (6, 11),
+        ]
+    
+    def test_every_team_is_placed_once(self):
+        """No seed is left out, whatever the team count."""
+        for count in range(2, 20):
+            pairs = _seeded_pairs(list(range(1, count + 1)))
+            placed = [team for pair in pairs for team in pair if team is not None]
+            assert sorted(placed) == list(range(1, count + 1))
+    
+    def test_fewer_than_two_teams(self):
+        """A single team cannot form a bracket."""
+        assert _seeded_pairs([1]) == []
+        assert _seeded_pairs([]) == []
+
+
+class TestCreateSingleEliminationMatches:
+    """Tests for create_single_elimination_matches method."""
+    
+    def test_byes_are_recorded_as_won(self, app, sample_tournament, mock_pubsub):
+        """Six teams get two byes that count as completed wins."""
+        with app.app_context():
+            for i in range(6):
+                db.session.add(Team(
+                    team_id=f'team-{i+1}', tournament_id=sample_tournament.id,
+                    name=f'Team {i+1}', captain=f'Captain {i+1}'
+                ))
+            db.session.commit()
+            
+            matches = MatchEngine(sample_tournament.tournament_id).create_single_elimination_matches()
+            
+            byes = [m for m in matches if m['team2'] is None]
+            assert len(matches) == 4
+            assert [m['winner'] for m in byes] == ['team-1', 'team-2']
+            assert all(m['status'] == 'completed' for m in byes)
+
+
+class TestRecordResult:
+    """Tests for record_result method."""
+    
+    def test_second_result_is_rejected(self, app, sample_tournament, sample_teams, sample_match, mock_pubsub):
+        """A match that already has a result keeps the first one."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            assert engine.record_result('test-match-001', winner_id='team-1')[0] is True
+            
+            success, message = engine.record_result('test-match-001', winner_id='team-2')
+            
+            assert success is False
+            assert message == 'Match test-match-001 is not pending'
+            assert Match.query.filter_by(match_id='test-match-001').one().winner_id == 'team-1'
+            assert Team.query.filter_by(team_id='team-1').one().wins == 1
+            assert Team.query.filter_by(team_id='team-2').one().losses == 1
+            assert EloHistory.query.count() == 2
+    
+    def test_claimed_match_leaves_teams_unchanged(self, app, sample_tournament, sample_teams, sample_match, mock_pubsub):
+        """Losing the claim to a concurrent result applies nothing."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            ratings = {t.team_id: t.elo_rating for t in Team.query.all()}
+            # This request loaded the match while pending; another one then completed it
+            match = Match.query.filter_by(match_id='test-match-001').one()
+            assert match.status == 'pending'
+            db.session.execute(
+                Match.__table__.update()
+                .where(Match.__table__.c.match_id == 'test-match-001')
+                .values(status='completed')
+            )
+            
+            success, message = engine.record_result('test-match-001', winner_id='team-2')
+            
+            assert success is False
+            assert message == 'Match test-match-001 is not pending'
+            for team in Team.query.all():
+                assert (team.wins, team.losses, team.points) == (0, 0, 0)
+                assert team.elo_rating == ratings[team.team_id]
+            assert EloHistory.query.count() == 0
+
+
+class TestAdvanceSingleElimination:
+    """Tests for advance_single_elimination method."""
+    
+    def test_advances_to_next_round(self, app, sample_tournament, sample_teams, mock_pubsub):
+        """A completed round should produce the next round's matches."""
+        with app.app_context():
+            engine = MatchEngine(sample_tournament.tournament_id)
+            engine.create_single_elimination_matches()
+            complete_round(sample_tournament.id, 1)
+            
+            is_complete, next_matches = engine.advance_single_elimination()
+            
+            assert is_complete is False
+            assert len(next_matches) == 2
+            assert engine.get_current_round() == 2
+    
+    def test_stale_engine_does_not_duplicate_round(self, app, sample_tournament, sample_teams, mock_pubsub):
+        """An engine built before another request advanced should not advance again."""
+        with app.app_context():
+            MatchEngine(sample_tournament.tournament_id).create_single_elimination_matches()
+            complete_round(sample_tournament.id, 1)
+            
+            stale = MatchEngine(sample_tournament.tournament_id)
+            MatchEngine(sample_tournament.tournament_id).advance_single_elimination()
+            
+            is_complete, next_matches = stale.advance_single_elimination()
+            
+            assert is_complete is False
+            assert next_matches is None
+            assert Match.query.filter_by(tournament_id=sample_tournament.id, round_num=2).count() == 2
+            assert stale.get_current_round() == 2
+    
+    def test_byes_advance_with_the_round(self, app, sample_tournament, mock_pubsub):
+        """A six-team bracket halves evenly down to a single final."""
+        with app.app_context():
+            for i in range(6):
+                db.session.add(Team(
+                    team_id=f'team-{i+1}', tournament_id=sample_tournament.id,
+                    name=f'Team {i+1}', captain=f'Captain {i+1}'
+                ))
+            db.session.commit()
+            
+            engine = MatchEngine(sample_tournament.tournament_id)
+            engine.create_single_elimination_matches()
+            complete_round(sample_tournament.id, 1)
+            _, round_two = engine.advance_single_elimination()
+            complete_round(sample_tournament.id, 2)
+            _, final = engine.advance_single_elimination()
+            complete_round(sample_tournament.id, 3)
+            
+            assert len(round_two) == 2
+            assert len(final) == 1
+            assert {final[0]['team1'], final[0]['team2']} == {'team-1', 'team-2'}
+            assert engine.advance_single_elimination() == (True, None)
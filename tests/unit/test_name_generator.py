@@ -1,12 +1,13 @@
 """
 Unit tests for name_generator module.
-Tests: generate_tournament_name, generate_match_name, generate_short_id
+Tests: generate_tournament_name, generate_match_name, generate_match_names, generate_short_id
 """
 import pytest
 import re
 from orchestrator.name_generator import (
     generate_tournament_name,
     generate_match_name,
+    generate_match_names,
     generate_short_id,
     ADJECTIVES,
     NOUNS,
@@ -259,3 +260,29 @@ class TestWordLists:
         # Should have enough combinations for unique tournament names
         combinations = len(ADJECTIVES) * len(NOUNS) * len(MATCH_DESCRIPTORS)
         assert combinations >= 10000
+
+
+class TestGenerateMatchNames:
+    """Tests for generate_match_names function."""
+    
+    def test_returns_requested_count(self):
+        """Should return exactly count names."""
+        assert len(generate_match_names(1, 8)) == 8
+    
+    def test_names_unique_within_round(self):
+        """Names drawn for one round should never collide."""
+        names = generate_match_names(1, 2000)
+        assert len(set(names)) == 2000
+    
+    def test_follows_match_name_pattern(self):
+        """Each name should follow r{round}-adjective-noun-descriptor."""
+        for name in generate_match_names(3, 50):
+            prefix, adjective, noun, descriptor = name.split('-')
+            assert prefix == 'r3'
+            assert adjective in ADJECTIVES
+            assert noun in NOUNS
+            assert descriptor in MATCH_DESCRIPTORS
+    
+    def test_zero_count(self):
+        """Zero matches should give an empty list."""
+        assert generate_match_names(1, 0) == []
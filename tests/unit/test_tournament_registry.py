@@ -1,6 +1,6 @@
 """
 Unit tests for TournamentRegistry class.
-Tests: create_tournament, get_tournament, list_tournaments, publish_tournament,
+Tests: create_tournament, get_tournament, get_tournaments_bulk, list_tournaments, publish_tournament,
        archive_tournament, delete_tournament, get_service_url
 """
 import pytest
@@ -109,6 +109,29 @@ class TestGetTournament:
             assert found is None
 
 
+class TestGetTournamentsBulk:
+    """Tests for get_tournaments_bulk method."""
+    
+    def test_keeps_requested_order_and_skips_missing(self, app, db_session):
+        """Should return found tournaments in the order requested."""
+        with app.app_context():
+            registry = TournamentRegistry()
+            
+            first = registry.create_tournament(name="First")
+            second = registry.create_tournament(name="Second")
+            
+            tournaments = registry.get_tournaments_bulk(
+                [second.tournament_id, "missing-id", first.tournament_id]
+            )
+            
+            assert [t.tournament_id for t in tournaments] == [second.tournament_id, first.tournament_id]
+    
+    def test_empty_ids(self, app, db_session):
+        """Should return an empty list without querying."""
+        with app.app_context():
+            assert TournamentRegistry().get_tournaments_bulk([]) == []
+
+
 class TestListTournaments:
     """Tests for list_tournaments method."""
     
@@ -163,6 +186,21 @@ class TestListTournaments:
             page2_ids = {t.id for t in page2}
             assert page1_ids.isdisjoint(page2_ids)
     
+    def test_list_with_cursor(self, app, db_session):
+        """Should page by id cursor without overlap."""
+        with app.app_context():
+            registry = TournamentRegistry()
+            
+            for i in range(7):
+                registry.create_tournament(name=f"Test {i}")
+            
+            page1 = registry.list_tournaments(limit=5)
+            page2 = registry.list_tournaments(limit=5, cursor=page1[-1].id)
+            
+            assert len(page1) == 5
+            assert len(page2) == 2
+            assert all(t.id < page1[-1].id for t in page2)
+    
     def test_list_ordered_by_created_at(self, app, db_session):
         """Should be ordered by created_at descending."""
         with app.app_context():